@@ -21,11 +21,13 @@ def main():
         print("No experiments found in 'experiments' directory.")
         sys.exit(0)
 
-    # Prompt user with autocomplete
+    # Prompt user with autocomplete; the validator runs per keystroke, so
+    # membership checks go against a frozenset rather than the list
+    experiments_set = frozenset(experiments)
     experiment_name = questionary.autocomplete(
         "Select an experiment to run:",
         choices=experiments,
-        validate=lambda text: text in experiments or "Please choose a valid experiment."
+        validate=lambda text: text in experiments_set or "Please choose a valid experiment."
     ).ask()
 
     if not experiment_name:
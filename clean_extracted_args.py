@@ -7,11 +7,46 @@ import json
 import re
 from pathlib import Path
 
+try:
+    import orjson             # C parser, ~3-10x faster than stdlib json
+except ModuleNotFoundError:   # pragma: no cover – optional dependency
+    orjson = None
+
+
+def load_json(path: Path):
+    """Load a JSON file, using orjson's native parser when available."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def dump_json(obj, path: Path) -> None:
+    """Write obj as indented JSON, using orjson's C encoder when available."""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w') as f:
+            # ensure_ascii=False skips the per-character escape loop
+            json.dump(obj, f, indent=2, ensure_ascii=False)
+
+# Compiled once at import — re.sub with string patterns churns the small
+# regex cache when called per argument.
+_ROMAN_RE = re.compile(r'^[IVX]+\.\s*')
+_LETTER_RE = re.compile(r'^[A-Z]\.\s*')
+
+# Acronyms/proper nouns kept uppercase, as frozensets for O(1) lookup
+_UPPERCASE_TERMS = frozenset(['FDA', 'FDCA', 'CBE', 'CRL', 'MERCK', 'LEVINE', 'CIRCUIT'])
+_UPPERCASE_POSSESSIVE_BASES = frozenset(['FDA', 'FDCA', 'MERCK', 'CIRCUIT'])
+
+# ASCII apostrophe and U+2019 right single quote
+_POSSESSIVE_SUFFIXES = ("'s", "’s")
+
 def clean_argument_text(text: str) -> str:
     """Clean up argument text to match sample format."""
     # Remove Roman numerals and section letters at the beginning
-    cleaned = re.sub(r'^[IVX]+\.\s*', '', text)
-    cleaned = re.sub(r'^[A-Z]\.\s*', '', cleaned)
+    cleaned = _ROMAN_RE.sub('', text)
+    cleaned = _LETTER_RE.sub('', cleaned)
     
     # Convert to sentence case (first letter uppercase, rest lowercase unless proper noun)
     if cleaned:
@@ -25,12 +60,12 @@ def clean_argument_text(text: str) -> str:
             for i in range(1, len(words)):
                 word = words[i]
                 # Keep certain terms uppercase (acronyms, legal terms)
-                if word.upper() in ['FDA', 'FDCA', 'CBE', 'CRL', 'MERCK', 'LEVINE', 'CIRCUIT']:
+                if word.upper() in _UPPERCASE_TERMS:
                     words[i] = word.upper()
-                # Handle possessives
-                elif word.endswith("'s") or word.endswith("'s"):
+                # Handle possessives (straight or curly apostrophe)
+                elif word.endswith(_POSSESSIVE_SUFFIXES):
                     base_word = word[:-2]
-                    if base_word.upper() in ['FDA', 'FDCA', 'MERCK', 'CIRCUIT']:
+                    if base_word.upper() in _UPPERCASE_POSSESSIVE_BASES:
                         words[i] = base_word.upper() + word[-2:]
                     else:
                         words[i] = word.lower()
@@ -42,48 +77,57 @@ def clean_argument_text(text: str) -> str:
     return cleaned
 
 def clean_arguments_recursive(args, is_top_level=True):
-    """Recursively clean all arguments in the structure."""
+    """Clean all arguments in the structure (iteratively, despite the name).
+
+    Uses an explicit stack of (source_list, dest_list, is_top_level)
+    frames instead of Python-level recursion, so deep argument trees
+    avoid the per-frame call overhead.
+    """
     cleaned_args = []
-    
-    for arg in args:
-        cleaned_arg = {
-            'argument': clean_argument_text(arg['argument'])
-        }
-        
-        # Only add 'type' for top-level arguments
-        if is_top_level and 'type' in arg:
-            cleaned_arg['type'] = arg['type']
-        
-        # Handle sub_arguments
-        if 'sub_arguments' in arg and arg['sub_arguments']:
-            # For sub-arguments, we need to maintain the structure but clean text
-            cleaned_sub_args = []
-            for sub_arg in arg['sub_arguments']:
-                if isinstance(sub_arg, dict):
-                    cleaned_sub = {
-                        'argument': clean_argument_text(sub_arg['argument'])
-                    }
-                    # Handle nested sub_arguments
-                    if 'sub_arguments' in sub_arg and sub_arg['sub_arguments']:
-                        cleaned_sub['sub_arguments'] = clean_arguments_recursive(sub_arg['sub_arguments'], is_top_level=False)
-                    cleaned_sub_args.append(cleaned_sub)
-                else:
-                    # Handle string sub-arguments (shouldn't happen in our format)
-                    cleaned_sub_args.append(clean_argument_text(str(sub_arg)))
-            
-            cleaned_arg['sub_arguments'] = cleaned_sub_args
-        else:
-            cleaned_arg['sub_arguments'] = []
-        
-        cleaned_args.append(cleaned_arg)
-    
+    stack = [(args, cleaned_args, is_top_level)]
+
+    while stack:
+        source, dest, top_level = stack.pop()
+
+        for arg in source:
+            cleaned_arg = {
+                'argument': clean_argument_text(arg['argument'])
+            }
+
+            # Only add 'type' for top-level arguments
+            if top_level and 'type' in arg:
+                cleaned_arg['type'] = arg['type']
+
+            # Handle sub_arguments
+            if 'sub_arguments' in arg and arg['sub_arguments']:
+                # For sub-arguments, we need to maintain the structure but clean text
+                cleaned_sub_args = []
+                for sub_arg in arg['sub_arguments']:
+                    if isinstance(sub_arg, dict):
+                        cleaned_sub = {
+                            'argument': clean_argument_text(sub_arg['argument'])
+                        }
+                        # Queue nested sub_arguments instead of recursing
+                        if 'sub_arguments' in sub_arg and sub_arg['sub_arguments']:
+                            cleaned_sub['sub_arguments'] = []
+                            stack.append((sub_arg['sub_arguments'], cleaned_sub['sub_arguments'], False))
+                        cleaned_sub_args.append(cleaned_sub)
+                    else:
+                        # Handle string sub-arguments (shouldn't happen in our format)
+                        cleaned_sub_args.append(clean_argument_text(str(sub_arg)))
+
+                cleaned_arg['sub_arguments'] = cleaned_sub_args
+            else:
+                cleaned_arg['sub_arguments'] = []
+
+            dest.append(cleaned_arg)
+
     return cleaned_args
 
 def main():
     # Load extracted arguments
     extracted_path = Path("extracted_arguments_test.json")
-    with open(extracted_path, 'r') as f:
-        extracted_args = json.load(f)
+    extracted_args = load_json(extracted_path)
     
     print(f"Loaded {len(extracted_args)} extracted arguments")
     
@@ -92,8 +136,7 @@ def main():
     
     # Save cleaned arguments
     cleaned_path = Path("cleaned_arguments.json")
-    with open(cleaned_path, 'w') as f:
-        json.dump(cleaned_args, f, indent=2)
+    dump_json(cleaned_args, cleaned_path)
     
     print(f"Saved cleaned arguments to {cleaned_path}")
     
@@ -108,8 +151,7 @@ def main():
     
     # Load sample for comparison
     sample_path = Path("data/sample_data.json")
-    with open(sample_path, 'r') as f:
-        sample_args = json.load(f)
+    sample_args = load_json(sample_path)
     
     print("\n=== SAMPLE FORMAT ===")
     print(f"1. {sample_args[0]['argument'][:100]}...")
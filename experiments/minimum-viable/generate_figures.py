@@ -5,6 +5,8 @@ Generate figures from the experiment data directly, bypassing Quarto issues.
 
 import pandas as pd
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # headless under Snakemake; no GUI event loop
 import matplotlib.pyplot as plt
 import seaborn as sns
 from pathlib import Path
@@ -23,14 +25,23 @@ data_dir = Path('processed_data')
 
 print("Loading experiment data...")
 
-# Load belief distributions
-beliefs_df = pd.read_parquet(data_dir / 'belief_distributions.parquet')
+# Load belief distributions. Parquet is columnar: project just the
+# columns the figures use so the rest is never decompressed.
+beliefs_df = pd.read_parquet(
+    data_dir / 'belief_distributions.parquet',
+    columns=['belief_type', 'answer', 'question_text', 'runtime_s', 'model_name'],
+    engine='pyarrow',
+)
 print(f"Loaded {len(beliefs_df)} belief measurements")
 
 # Load other files for context
 try:
-    with open(data_dir / 'extracted_arguments.json', 'r') as f:
-        arguments = json.load(f)
+    try:
+        import orjson
+        arguments = orjson.loads((data_dir / 'extracted_arguments.json').read_bytes())
+    except ModuleNotFoundError:
+        with open(data_dir / 'extracted_arguments.json', 'r') as f:
+            arguments = json.load(f)
     print(f"Loaded {len(arguments)} legal arguments")
 except:
     arguments = []
@@ -43,17 +54,14 @@ if not character_beliefs.empty:
     # Create character beliefs plot
     plt.figure(figsize=(12, 8))
     
-    # Extract attribute names for better display
-    def extract_attribute(question_text):
-        """Extract the attribute name from the question text."""
-        # Look for the pattern after "appellant's" and before "based on"
-        import re
-        match = re.search(r"appellant's (.+?) based on", question_text)
-        if match:
-            return match.group(1)
-        return question_text[:50] + "..."
-    
-    character_beliefs['attribute'] = character_beliefs['question_text'].apply(extract_attribute)
+    # Extract attribute names for better display: one vectorized regex pass
+    # (pattern after "appellant's" and before "based on") instead of a
+    # Python-level .apply per row, falling back to a truncated question.
+    character_beliefs['attribute'] = (
+        character_beliefs['question_text']
+        .str.extract(r"appellant's (.+?) based on", expand=False)
+        .fillna(character_beliefs['question_text'].str[:50] + "...")
+    )
     
     # Create box plot
     sns.boxplot(data=character_beliefs, y='attribute', x='answer')
@@ -71,13 +79,15 @@ if not character_beliefs.empty:
                 bbox=dict(boxstyle='round,pad=0.3', facecolor='white', alpha=0.8))
     
     plt.tight_layout()
-    plt.savefig(figures_dir / 'character_beliefs.svg', format='svg', dpi=300, bbox_inches='tight')
+    plt.savefig(figures_dir / 'character_beliefs.svg', format='svg', bbox_inches='tight')
     plt.savefig(figures_dir / 'character_beliefs.png', format='png', dpi=300, bbox_inches='tight')
-    plt.show()
-    
-    # Statistical summary
+    plt.close()
+
+    # Statistical summary. Grouping on categoricals with observed=True
+    # hashes int codes instead of strings and skips the key sort.
     print("\nCharacter Belief Statistics:")
-    char_summary = character_beliefs.groupby('attribute')['answer'].agg(['mean', 'std', 'count']).round(3)
+    character_beliefs['attribute'] = character_beliefs['attribute'].astype('category')
+    char_summary = character_beliefs.groupby('attribute', observed=True, sort=False)['answer'].agg(['mean', 'std', 'count']).round(3)
     print(char_summary)
     
     # Save summary to CSV
@@ -111,9 +121,9 @@ else:
     plt.text(0.5, 0.5, 'No character belief data', ha='center', va='center', transform=plt.gca().transAxes)
 
 plt.tight_layout()
-plt.savefig(figures_dir / 'distribution_analysis.svg', format='svg', dpi=300, bbox_inches='tight')
+plt.savefig(figures_dir / 'distribution_analysis.svg', format='svg', bbox_inches='tight')
 plt.savefig(figures_dir / 'distribution_analysis.png', format='png', dpi=300, bbox_inches='tight')
-plt.show()
+plt.close()
 
 # Runtime analysis
 print("\n=== Runtime Analysis ===")
@@ -132,13 +142,14 @@ plt.xlabel('Runtime (seconds)')
 plt.ylabel('Model')
 
 plt.tight_layout()
-plt.savefig(figures_dir / 'runtime_analysis.svg', format='svg', dpi=300, bbox_inches='tight')
+plt.savefig(figures_dir / 'runtime_analysis.svg', format='svg', bbox_inches='tight')
 plt.savefig(figures_dir / 'runtime_analysis.png', format='png', dpi=300, bbox_inches='tight')
-plt.show()
+plt.close()
 
 # Model performance summary
 print("\n=== Model Performance Summary ===")
-model_performance = beliefs_df.groupby('model_name').agg({
+beliefs_df['model_name'] = beliefs_df['model_name'].astype('category')
+model_performance = beliefs_df.groupby('model_name', observed=True, sort=False).agg({
     'answer': ['count', 'mean', 'std'],
     'runtime_s': ['mean', 'std']
 }).round(3)
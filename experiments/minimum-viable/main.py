@@ -9,50 +9,80 @@ This script implements the full pipeline described in the design spec:
 5. Measure final belief distributions for case and character beliefs
 """
 
+import asyncio
+import hashlib
 import json
 import yaml
 from pathlib import Path
 from typing import Dict, Any, List
-import pandas as pd
-from snakemake.script import snakemake
+
+try:
+    import orjson  # C-backed, ~5-10x faster serialization
+except ModuleNotFoundError:
+    orjson = None
+
+# pandas/numpy are imported lazily where needed, and snakemake only in
+# the __main__ wrapper: both cost hundreds of ms at interpreter start and
+# aren't used when this module is imported by the test suite
 
 from pedadog import (
     generate_belief_vector_from_pdfs,
     create_character_questions_file,
     load_character_questions,
-    get_question_texts,
-    thermo
+    get_question_texts_list,
+    athermo,
+    thermo_multi_stage
 )
 from simple_models import get_models, create_judge_model
 
 
+# C-backed loader when libyaml is present (~3x faster parse)
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_CONFIG_CACHE: Dict[Any, Dict[str, Any]] = {}
+
+
 def load_config() -> Dict[str, Any]:
-    """Load experiment configuration."""
+    """Load experiment configuration (parsed once per path + mtime)."""
     config_path = Path(__file__).parent.parent.parent / "pedadog" / "config.yaml"
-    with open(config_path, 'r') as f:
-        return yaml.safe_load(f)
+    key = (str(config_path), config_path.stat().st_mtime_ns)
+    if key not in _CONFIG_CACHE:
+        _CONFIG_CACHE.clear()
+        with open(config_path, 'r') as f:
+            _CONFIG_CACHE[key] = yaml.load(f, Loader=_YAML_LOADER)
+    return _CONFIG_CACHE[key]
 
 
-def load_pdf_texts(config: Dict[str, Any]) -> tuple[str, str]:
-    """Load and truncate PDF texts for context."""
+def load_pdf_texts(
+    config: Dict[str, Any],
+    petitioner_path: Path = None,
+    respondent_path: Path = None,
+) -> tuple[str, str]:
+    """Load and truncate PDF texts for context.
+
+    Paths are injected by the caller (the Snakemake wrapper passes its
+    declared inputs); config supplies the defaults otherwise.
+    """
     from pedadog.generate_belief_vector import extract_pdf_text
-    
-    # Get paths from config or snakemake
-    if hasattr(snakemake, 'input'):
-        petitioner_path = Path(snakemake.input.petitioner_pdf)
-        respondent_path = Path(snakemake.input.respondent_pdf)
-    else:
+
+    if petitioner_path is None:
         petitioner_path = Path(config['paths']['case_pdfs']['petitioner'])
+    if respondent_path is None:
         respondent_path = Path(config['paths']['case_pdfs']['respondent'])
-    
-    petitioner_text = extract_pdf_text(petitioner_path)
-    respondent_text = extract_pdf_text(respondent_path)
-    
-    # Truncate for context
+
+
+    # Push the context limit into the extractor so pages past the budget
+    # are never decoded
     limit = config['experiments']['minimum_viable']['brief_context_limit']
-    petitioner_text = petitioner_text[:limit]
-    respondent_text = respondent_text[:limit]
-    
+
+    # The two briefs are independent, so extract them concurrently: stage
+    # wall time becomes max(petitioner_t, respondent_t) instead of the sum
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        petitioner_future = executor.submit(extract_pdf_text, petitioner_path, limit)
+        respondent_future = executor.submit(extract_pdf_text, respondent_path, limit)
+        petitioner_text = petitioner_future.result()
+        respondent_text = respondent_future.result()
+
     return petitioner_text, respondent_text
 
 
@@ -112,7 +142,36 @@ def create_sample_data_files(config: Dict[str, Any]):
             f.write("On a scale of 0 to 1, how would you rate the appellant's ATTRIBUTE_TEXT based on this interaction?")
 
 
-def run_experiment():
+def dump_json(obj: Any, path: Path) -> None:
+    """Write obj as indented JSON, via orjson when it is installed."""
+    if orjson is not None:
+        Path(path).write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w') as f:
+            json.dump(obj, f, indent=2)
+
+
+# Column order of the belief-distributions table (kept as a constant so
+# downstream readers can rely on a stable schema)
+BELIEF_COLUMNS = (
+    'case_id', 'question_id', 'question_text', 'model_name', 'draw_idx',
+    'answer', 'timestamp', 'runtime_s', 'experiment_stage', 'belief_type',
+)
+
+
+def question_id(question: str) -> int:
+    """Stable 32-bit ID for a question text.
+
+    Python's built-in hash is salted per process, so IDs from hash() can't
+    be joined against parquet files from earlier runs. blake2b is keyed
+    only by content and reproducible everywhere.
+    """
+    return int.from_bytes(
+        hashlib.blake2b(question.encode(), digest_size=4).digest(), 'big'
+    )
+
+
+def run_experiment(petitioner_path: Path = None, respondent_path: Path = None):
     """Run the complete minimum viable experiment."""
     print("Starting minimum viable pedadog experiment...")
     
@@ -133,7 +192,9 @@ def run_experiment():
     try:
         # Step 1: Load PDF texts (for context - in real experiment would extract arguments)
         print("Loading PDF texts...")
-        petitioner_text, respondent_text = load_pdf_texts(config)
+        petitioner_text, respondent_text = load_pdf_texts(
+            config, petitioner_path, respondent_path
+        )
         
         # For now, create mock arguments since we may not have actual PDFs
         print("Creating mock case arguments...")
@@ -156,8 +217,7 @@ def run_experiment():
         ]
         
         # Save arguments
-        with open(results_dir / "extracted_arguments.json", 'w') as f:
-            json.dump(mock_arguments, f, indent=2)
+        dump_json(mock_arguments, results_dir / "extracted_arguments.json")
         
     except Exception as e:
         print(f"Warning: Could not load PDFs ({e}), using mock arguments")
@@ -178,8 +238,7 @@ def run_experiment():
             }
         ]
         
-        with open(results_dir / "extracted_arguments.json", 'w') as f:
-            json.dump(mock_arguments, f, indent=2)
+        dump_json(mock_arguments, results_dir / "extracted_arguments.json")
     
     # Step 2: Generate judge response to petitioner brief
     print("Generating judge response...")
@@ -193,12 +252,14 @@ def run_experiment():
     case_questions = [arg["argument"] for arg in mock_arguments]
     brief_context = f"Petitioner brief: {petitioner_text}\n\nJudge response: {judge_response}"
     
-    initial_beliefs = thermo(
+    # All (question, sample) pairs fire concurrently via athermo — the
+    # workload is network-bound, so wall time is ~1 RTT per concurrency slot
+    initial_beliefs = asyncio.run(athermo(
         questions=case_questions,
         context=brief_context,
         models=[judge_model],
         n_samples=config['sampling']['n_samples']
-    )
+    ))
     
     # Step 4: Generate appellant response
     print("Generating appellant response...")
@@ -216,27 +277,23 @@ def run_experiment():
     character_questions_data = create_character_questions_file(
         rubric_path, template_path, questions_path
     )
-    character_questions = get_question_texts(character_questions_data)
+    # thermo_multi_stage iterates the questions more than once, so take
+    # the materialized list rather than the single-pass generator
+    character_questions = get_question_texts_list(character_questions_data)
     
     # Step 6: Measure final belief distributions
     print("Measuring final belief distributions...")
-    
-    # Case beliefs with appellant response included
-    final_context = f"{brief_context}\n\nAppellant response: {appellant_response}"
-    
-    final_case_beliefs = thermo(
-        questions=case_questions,
-        context=final_context,
-        models=[judge_model],
-        n_samples=config['sampling']['n_samples']
-    )
-    
-    # Character beliefs about appellant
-    character_context = f"Based on this legal interaction:\n\n{final_context}"
-    
-    character_beliefs = thermo(
-        questions=character_questions,
-        context=character_context,
+
+    # The final-case and character stages share the brief + judge +
+    # appellant text as a byte-identical growing prefix, so run them as one
+    # fused multi-stage measurement: the provider's prompt cache covers the
+    # shared context and only each stage's suffix pays fresh prefill. The
+    # character stage stays batched (one JSON prompt per sample).
+    final_case_beliefs, character_beliefs = thermo_multi_stage(
+        stages=[
+            (case_questions, f"{brief_context}\n\nAppellant response: {appellant_response}"),
+            (character_questions, "Based on this legal interaction:", True),
+        ],
         models=[judge_model],
         n_samples=config['sampling']['n_samples']
     )
@@ -244,52 +301,100 @@ def run_experiment():
     # Step 7: Save results to structured format
     print("Saving results...")
     
-    def beliefs_to_dataframe(belief_results, experiment_stage, belief_type):
-        """Convert belief results to DataFrame format."""
-        rows = []
-        
-        for model_name in belief_results.model_names:
-            for question in belief_results.questions:
-                distribution = belief_results.get(model_name, question)
-                if distribution:
-                    for i, response in enumerate(distribution.responses):
-                        if response.numeric_value is not None:
-                            rows.append({
-                                'case_id': 'minimum_viable_experiment',
-                                'question_id': hash(question) % 10000,  # Simple hash for ID
-                                'question_text': question,
-                                'model_name': model_name,
-                                'draw_idx': i,
-                                'answer': response.numeric_value,
-                                'timestamp': response.timestamp,
-                                'runtime_s': response.runtime_s,
-                                'experiment_stage': experiment_stage,
-                                'belief_type': belief_type
-                            })
-        
-        return pd.DataFrame(rows)
-    
-    # Combine all results
-    all_results = []
-    
-    # Initial case beliefs
-    initial_df = beliefs_to_dataframe(initial_beliefs, 'initial', 'case')
-    all_results.append(initial_df)
-    
-    # Final case beliefs  
-    final_df = beliefs_to_dataframe(final_case_beliefs, 'final', 'case')
-    all_results.append(final_df)
-    
-    # Character beliefs
-    character_df = beliefs_to_dataframe(character_beliefs, 'final', 'character')
-    all_results.append(character_df)
-    
-    # Combine and save
-    combined_df = pd.concat(all_results, ignore_index=True)
-    combined_df.to_parquet(results_dir / "belief_distributions.parquet", index=False)
-    
-    # Also save as CSV for easier inspection
-    combined_df.to_csv(results_dir / "belief_distributions.csv", index=False)
+    def beliefs_to_dataframe(stages):
+        """Assemble one DataFrame from several belief-result stages.
+
+        stages is a list of (belief_results, experiment_stage, belief_type)
+        triples. Valid responses are counted first so typed NumPy columns
+        can be preallocated and filled by index, then the frame is built
+        once — no per-row dicts and no pd.concat copies.
+        """
+        import numpy as np
+        import pandas as pd
+
+        # Pass 1: flatten distributions and count valid responses
+        flat = []
+        total = 0
+        for belief_results, experiment_stage, belief_type in stages:
+            qid_map = {q: question_id(q) for q in belief_results.questions}
+            for model_name in belief_results.model_names:
+                for question in belief_results.questions:
+                    distribution = belief_results.get(model_name, question)
+                    if distribution:
+                        n_valid = sum(1 for r in distribution.responses
+                                      if r.numeric_value is not None)
+                        total += n_valid
+                        flat.append((qid_map[question], question, model_name,
+                                     experiment_stage, belief_type, distribution))
+
+        # Pass 2: fill preallocated columnar arrays
+        question_id_col = np.empty(total, dtype=np.uint32)
+        draw_idx = np.empty(total, dtype=np.int32)
+        answer = np.empty(total, dtype=np.float32)
+        timestamp = np.empty(total, dtype=np.float64)
+        runtime_s = np.empty(total, dtype=np.float32)
+        question_text = np.empty(total, dtype=object)
+        model_col = np.empty(total, dtype=object)
+        stage_col = np.empty(total, dtype=object)
+        type_col = np.empty(total, dtype=object)
+
+        pos = 0
+        for qid, question, model_name, experiment_stage, belief_type, distribution in flat:
+            for i, response in enumerate(distribution.responses):
+                if response.numeric_value is None:
+                    continue
+                question_id_col[pos] = qid
+                question_text[pos] = question
+                model_col[pos] = model_name
+                draw_idx[pos] = i
+                answer[pos] = response.numeric_value
+                timestamp[pos] = response.timestamp
+                runtime_s[pos] = response.runtime_s
+                stage_col[pos] = experiment_stage
+                type_col[pos] = belief_type
+                pos += 1
+
+        # Repeated small string columns become categoricals at construction
+        # time: codes instead of per-row object pointers (~5x smaller, and
+        # groupbys downstream operate on integer codes)
+        df = pd.DataFrame({
+            'case_id': pd.Categorical(['minimum_viable_experiment'] * total),
+            'question_id': question_id_col,
+            'question_text': question_text,
+            'model_name': pd.Categorical(model_col),
+            'draw_idx': draw_idx,
+            'answer': answer,
+            'timestamp': timestamp,
+            'runtime_s': runtime_s,
+            'experiment_stage': pd.Categorical(stage_col),
+            'belief_type': pd.Categorical(type_col),
+        })
+        assert tuple(df.columns) == BELIEF_COLUMNS
+        return df
+
+    # Combine all results in a single build
+    combined_df = beliefs_to_dataframe([
+        (initial_beliefs, 'initial', 'case'),
+        (final_case_beliefs, 'final', 'case'),
+        (character_beliefs, 'final', 'character'),
+    ])
+    # Write Parquet directly through pyarrow: zstd + dictionary encoding on
+    # the repeated string columns keeps the file small and the write fast
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    table = pa.Table.from_pandas(combined_df, preserve_index=False)
+    pq.write_table(
+        table,
+        results_dir / "belief_distributions.parquet",
+        compression='zstd',
+        use_dictionary=['model_name', 'experiment_stage', 'belief_type', 'question_text'],
+    )
+
+    # CSV duplicates the table as slow float-to-text formatting; only write
+    # it when explicitly requested for inspection
+    if config.get('debug_csv'):
+        combined_df.to_csv(results_dir / "belief_distributions.csv", index=False)
     
     print(f"Experiment completed! Results saved to {results_dir}")
     print(f"Total belief measurements: {len(combined_df)}")
@@ -297,5 +402,19 @@ def run_experiment():
     print(f"Belief types: {combined_df['belief_type'].unique()}")
 
 
+def main():
+    """Entry point: read Snakemake inputs when run as a script job."""
+    petitioner_path = None
+    respondent_path = None
+    try:
+        from snakemake.script import snakemake
+    except ImportError:
+        snakemake = None
+    if snakemake is not None and hasattr(snakemake, 'input'):
+        petitioner_path = Path(snakemake.input.petitioner_pdf)
+        respondent_path = Path(snakemake.input.respondent_pdf)
+    run_experiment(petitioner_path, respondent_path)
+
+
 if __name__ == "__main__":
-    run_experiment()
\ No newline at end of file
+    main()
\ No newline at end of file
@@ -5,86 +5,186 @@ This module provides appellant and judge model instances with
 appropriate prompting for the Supreme Court context.
 """
 
-import yaml
+import asyncio
+import hashlib
+import inspect
+import json
+
 from pathlib import Path
 from pedadog.models import create_model_from_config, BaseLLM
 
 
+def _accepts_system_prefix(model) -> bool:
+    """Whether model.prompt accepts the system_prefix keyword."""
+    try:
+        return "system_prefix" in inspect.signature(model.prompt).parameters
+    except (TypeError, ValueError):
+        return False
+
+
+_CONFIG_CACHE: dict = {}
+
+
 def load_config() -> dict:
-    """Load configuration from config.yaml."""
+    """Load configuration from config.yaml (parsed once per path + mtime)."""
     config_path = Path(__file__).parent.parent.parent / "pedadog" / "config.yaml"
-    
-    with open(config_path, 'r') as f:
-        config = yaml.safe_load(f)
-    
-    return config
+    key = (str(config_path), config_path.stat().st_mtime_ns)
+    if key not in _CONFIG_CACHE:
+        # yaml is imported lazily: cache hits (the common case) skip it
+        # entirely, and cold start doesn't pay for it unless config is read
+        import yaml
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)  # C-backed when libyaml is present
+        _CONFIG_CACHE.clear()
+        with open(config_path, 'r') as f:
+            _CONFIG_CACHE[key] = yaml.load(f, Loader=loader)
+    return _CONFIG_CACHE[key]
+
+
+class CachedLLM:
+    """Exact-match response cache in front of a base model.
+
+    Keys on sha256(model name + system prompt + text), so byte-identical
+    prompts cost one backend call. Hits persist across runs via an
+    append-only JSON Lines file when cache_path is given.
+
+    Note: thermo's Monte Carlo loop issues byte-identical prompts per
+    sample, so caching collapses those distributions to a point — only
+    wrap models used for one-shot generation (judge/appellant responses)
+    unless that is intended.
+    """
+
+    __slots__ = ('base_model', 'name', 'cache_path', '_cache')
+
+    def __init__(self, base_model: BaseLLM, cache_path: Path = None):
+        self.base_model = base_model
+        self.name = base_model.name
+        self.cache_path = Path(cache_path) if cache_path else None
+        self._cache = {}
+        if self.cache_path and self.cache_path.exists():
+            with open(self.cache_path, 'r') as f:
+                for line in f:
+                    entry = json.loads(line)
+                    self._cache[entry["key"]] = entry["response"]
+
+    def _key(self, text: str) -> str:
+        system_prompt = getattr(self.base_model, 'system_prompt', '')
+        payload = f"{self.name}\x00{system_prompt}\x00{text}"
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def prompt(self, text: str) -> str:
+        """Return the cached response for identical prompts, else call through."""
+        key = self._key(text)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        response = self.base_model.prompt(text)
+        self._cache[key] = response
+        if self.cache_path:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.cache_path, 'a') as f:
+                f.write(json.dumps({"key": key, "response": response}) + "\n")
+        return response
 
 
 class AppellantModel:
     """Wrapper for appellant (lawyer) model with specific prompting."""
-    
+
+    __slots__ = ('base_model', 'behavior_prompt', 'name', '_use_system_prefix', '_prefix')
+
     def __init__(self, base_model: BaseLLM, config: dict):
         self.base_model = base_model
         self.behavior_prompt = config['prompts']['appellant_behavior']
         self.name = f"appellant-{base_model.name}"
-    
+        # Route the static behavior prompt through a per-call system
+        # message so every request shares a byte-identical prefix and hits
+        # the provider-side prompt/KV cache. Passed per call rather than
+        # written onto base_model: create_model_from_config returns shared
+        # cached instances, so mutating their system_prompt would leak one
+        # wrapper's persona into every other wrapper on the same config.
+        self._use_system_prefix = _accepts_system_prefix(base_model)
+        # Concat fallback prefix, built once instead of re-copied per call
+        self._prefix = self.behavior_prompt + "\n\n"
+
     def prompt(self, text: str) -> str:
         """Send prompt with appellant behavior context."""
-        full_prompt = f"{self.behavior_prompt}\n\n{text}"
-        return self.base_model.prompt(full_prompt)
+        if self._use_system_prefix:
+            return self.base_model.prompt(text, system_prefix=self.behavior_prompt)
+        return self.base_model.prompt(self._prefix + text)
+
+    async def aprompt(self, text: str) -> str:
+        """Async prompt for athermo; the Azure client is sync, so run in a thread."""
+        return await asyncio.to_thread(self.prompt, text)
 
 
 class JudgeModel:
     """Wrapper for judge model with specific prompting."""
-    
+
+    __slots__ = ('base_model', 'behavior_prompt', 'name', '_use_system_prefix', '_prefix')
+
     def __init__(self, base_model: BaseLLM, config: dict):
         self.base_model = base_model
         self.behavior_prompt = config['prompts']['judge_behavior']
         self.name = f"judge-{base_model.name}"
-    
+        # Same per-call static-prefix routing as AppellantModel (see above)
+        self._use_system_prefix = _accepts_system_prefix(base_model)
+        # Concat fallback prefix, built once instead of re-copied per call
+        self._prefix = self.behavior_prompt + "\n\n"
+
     def prompt(self, text: str) -> str:
         """Send prompt with judge behavior context."""
-        full_prompt = f"{self.behavior_prompt}\n\n{text}"
-        return self.base_model.prompt(full_prompt)
+        if self._use_system_prefix:
+            return self.base_model.prompt(text, system_prefix=self.behavior_prompt)
+        return self.base_model.prompt(self._prefix + text)
 
+    async def aprompt(self, text: str) -> str:
+        """Async prompt for athermo; the Azure client is sync, so run in a thread."""
+        return await asyncio.to_thread(self.prompt, text)
 
-def create_appellant_model(config: dict = None) -> AppellantModel:
+
+def create_appellant_model(config: dict = None, cache_path: Path = None) -> AppellantModel:
     """
     Create an appellant model instance.
-    
+
     Args:
         config: Configuration dictionary (loads from file if None)
-        
+        cache_path: Optional JSONL file enabling exact-match response caching
+
     Returns:
         Configured appellant model
     """
     if config is None:
         config = load_config()
-    
+
     # Use appellant-specific config if available, otherwise default
     model_config = config['llms'].get('appellant_model', config['llms']['default'])
     base_model = create_model_from_config(model_config)
-    
+    if cache_path is not None:
+        base_model = CachedLLM(base_model, cache_path)
+
     return AppellantModel(base_model, config)
 
 
-def create_judge_model(config: dict = None) -> JudgeModel:
+def create_judge_model(config: dict = None, cache_path: Path = None) -> JudgeModel:
     """
     Create a judge model instance.
-    
+
     Args:
         config: Configuration dictionary (loads from file if None)
-        
+        cache_path: Optional JSONL file enabling exact-match response caching
+
     Returns:
         Configured judge model
     """
     if config is None:
         config = load_config()
-    
+
     # Use judge-specific config if available, otherwise default
     model_config = config['llms'].get('judge_model', config['llms']['default'])
     base_model = create_model_from_config(model_config)
-    
+    if cache_path is not None:
+        base_model = CachedLLM(base_model, cache_path)
+
     return JudgeModel(base_model, config)
 
 
@@ -8,11 +8,33 @@ This module tests:
 """
 
 import json
+import re
 import pytest
 from pathlib import Path
 import numpy as np
 from datetime import datetime
 
+try:
+    import orjson  # C-backed, ~5-10x faster (de)serialization
+except ModuleNotFoundError:
+    orjson = None
+
+
+def _dumps_line(entry) -> str:
+    """Serialize one log entry to a JSON line."""
+    if orjson is not None:
+        return orjson.dumps(entry).decode()
+    return json.dumps(entry)
+
+
+def _dump_json(obj, path) -> None:
+    """Write obj as indented JSON, via orjson when it is installed."""
+    if orjson is not None:
+        Path(path).write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w') as f:
+            json.dump(obj, f, indent=2)
+
 # Add parent directories to path for imports
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
@@ -23,19 +45,39 @@ from pedadog.models import MockLLM
 from simple_models import JudgeModel, load_config
 
 
+# One compiled pattern classifies a query in a single scan instead of
+# several lowercase + substring passes per entry
+_CLASSIFY_RE = re.compile(
+    r"(?i)(?P<arg>agree with[^\n]*?(?:petitioner|respondent))"
+    r"|(?P<char>rate the appellant|based on this legal interaction)"
+)
+
+
 class LoggingJudgeModel:
     """Judge model wrapper that logs all queries."""
     
-    def __init__(self, base_judge_model, log_dir: Path):
+    def __init__(self, base_judge_model, log_dir: Path, response_cache: dict = None):
         self.base_model = base_judge_model
         self.log_dir = Path(log_dir)
         self.log_dir.mkdir(parents=True, exist_ok=True)
         self.queries = []
         self.name = f"logging-{base_judge_model.name}"
+        # Memoizes responses by exact prompt text; pass a shared dict to
+        # let several logging judges reuse each other's results
+        self._response_cache = response_cache if response_cache is not None else {}
+        # Category counts maintained incrementally as queries arrive, so
+        # get_query_summary never rescans the full log
+        self._categories = {
+            "argument_beliefs": 0,
+            "character_assessments": 0,
+            "other": 0
+        }
         
-        # Create a timestamped log file
+        # Create a timestamped log file (JSON Lines: one entry per line,
+        # appended as queries arrive instead of rewriting the whole log)
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        self.log_file = self.log_dir / f"judge_queries_{timestamp}.json"
+        self.log_file = self.log_dir / f"judge_queries_{timestamp}.jsonl"
+        self._last_written_idx = 0
     
     def prompt(self, text: str) -> str:
         """Log the query and pass to base model."""
@@ -46,14 +88,22 @@ class LoggingJudgeModel:
             "query_number": len(self.queries) + 1
         }
         
-        # Get response from base model
-        response = self.base_model.prompt(text)
-        
+        # Reuse a memoized response for a repeated prompt; otherwise call
+        # the base model and remember the result
+        cached = self._response_cache.get(text)
+        if cached is not None:
+            response = cached
+            query_entry["cached"] = True
+        else:
+            response = self.base_model.prompt(text)
+            self._response_cache[text] = response
+
         # Add response to log entry
         query_entry["response"] = response
         
         # Store in memory
         self.queries.append(query_entry)
+        self._categories[self._classify(text)] += 1
         
         # Write to file (append mode)
         self._save_queries()
@@ -61,9 +111,25 @@ class LoggingJudgeModel:
         return response
     
     def _save_queries(self):
-        """Save all queries to JSON file."""
-        with open(self.log_file, 'w') as f:
-            json.dump(self.queries, f, indent=2)
+        """Append queries not yet on disk to the JSON Lines log.
+
+        Rewriting the full list on every prompt made logging O(N^2) in
+        total bytes written; appending only new entries keeps it O(N).
+        """
+        if self._last_written_idx >= len(self.queries):
+            return
+        with open(self.log_file, 'a') as f:
+            for entry in self.queries[self._last_written_idx:]:
+                f.write(_dumps_line(entry) + "\n")
+        self._last_written_idx = len(self.queries)
+
+    @staticmethod
+    def read_query_log(log_file):
+        """Stream entries back from a JSON Lines query log."""
+        loads = orjson.loads if orjson is not None else json.loads
+        with open(log_file, 'r') as f:
+            for line in f:
+                yield loads(line)
     
     def get_query_summary(self):
         """Get summary of logged queries."""
@@ -74,24 +140,17 @@ class LoggingJudgeModel:
         }
         return summary
     
+    @staticmethod
+    def _classify(text: str) -> str:
+        """Classify one query with a single compiled-regex scan."""
+        m = _CLASSIFY_RE.search(text)
+        if m is None:
+            return "other"
+        return "argument_beliefs" if m.group('arg') else "character_assessments"
+
     def _categorize_queries(self):
-        """Categorize queries by type."""
-        categories = {
-            "argument_beliefs": 0,
-            "character_assessments": 0,
-            "other": 0
-        }
-        
-        for query in self.queries:
-            text = query["query"].lower()
-            if "agree with" in text and ("petitioner" in text or "respondent" in text):
-                categories["argument_beliefs"] += 1
-            elif "rate the appellant" in text or "based on this legal interaction" in text:
-                categories["character_assessments"] += 1
-            else:
-                categories["other"] += 1
-        
-        return categories
+        """Return query counts by type (maintained incrementally)."""
+        return dict(self._categories)
 
 
 def test_extract_arguments():
@@ -119,8 +178,7 @@ def test_extract_arguments():
     output_dir.mkdir(exist_ok=True)
     
     output_file = output_dir / "test_extracted_arguments.json"
-    with open(output_file, 'w') as f:
-        json.dump(arguments, f, indent=2)
+    _dump_json(arguments, output_file)
     
     print(f"Extracted arguments saved to: {output_file}")
     
@@ -173,9 +231,14 @@ def test_belief_vector_with_logging():
     # Create judge model with mock base
     judge_model = JudgeModel(mock_base, config)
     
-    # Wrap with logging
-    logging_judge1 = LoggingJudgeModel(judge_model, processed_data_dir / "judge1_logs")
-    logging_judge2 = LoggingJudgeModel(judge_model, processed_data_dir / "judge2_logs")
+    # Wrap with logging; the judges share one response cache, so judge 2's
+    # duplicate prompt stream reuses judge 1's (deterministic) responses
+    # instead of re-driving the base model
+    shared_cache = {}
+    logging_judge1 = LoggingJudgeModel(judge_model, processed_data_dir / "judge1_logs",
+                                       response_cache=shared_cache)
+    logging_judge2 = LoggingJudgeModel(judge_model, processed_data_dir / "judge2_logs",
+                                       response_cache=shared_cache)
     
     # Path to character rubric
     rubric_path = data_dir / "moot_rubric.txt"
@@ -238,8 +301,7 @@ def test_belief_vector_with_logging():
             serializable[question] = values.tolist()
         serializable_beliefs.append(serializable)
     
-    with open(output_file, 'w') as f:
-        json.dump(serializable_beliefs, f, indent=2)
+    _dump_json(serializable_beliefs, output_file)
     
     print(f"✓ Belief distributions saved to: {output_file}")
     
@@ -338,9 +400,9 @@ def test_all():
     print("\nCheck the processed_data directory for:")
     print("  - test_extracted_arguments.json")
     print("  - test_belief_distributions.json")
-    print("  - judge1_logs/judge_queries_*.json")
-    print("  - judge2_logs/judge_queries_*.json")
-    print("  - character_test_logs/judge_queries_*.json")
+    print("  - judge1_logs/judge_queries_*.jsonl")
+    print("  - judge2_logs/judge_queries_*.jsonl")
+    print("  - character_test_logs/judge_queries_*.jsonl")
 
 
 if __name__ == "__main__":
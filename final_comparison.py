@@ -4,55 +4,100 @@ Final comparison of extracted vs sample arguments.
 """
 
 import json
+import operator
+import sys
 from pathlib import Path
 
+try:
+    import orjson  # C-backed parser, ~2-5x faster on multi-MB dumps
+except ModuleNotFoundError:
+    orjson = None
+
+
+def _load_json(path: Path):
+    """Parse a JSON file, via orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(Path(path).read_bytes())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+# Hoisted out of the comparison loops (lift-out-of-hot-path)
+_get_argument = operator.itemgetter('argument')
+
+
+def _texts_match(a, b):
+    """Equality with identity and hash prefilters.
+
+    str hashes are cached after first compute, so on mostly-mismatching
+    runs the hash comparison rejects without touching b's character data.
+    """
+    if a is b:
+        return True
+    if hash(a) != hash(b):
+        return False
+    return a == b
+
 def compare_exact_match(extracted, sample):
-    """Compare extracted arguments with sample for exact matches."""
-    print("=== EXACT ARGUMENT MATCHING ===")
-    
+    """Compare extracted arguments with sample for exact matches.
+
+    Single pass: prints the per-item diff and returns (exact_matches,
+    total_args) so callers don't re-walk the lists for totals.
+    """
+    # Buffer the report and emit it in one write: per-line print acquires
+    # the stdout lock and flushes a syscall per newline
+    lines = ["=== EXACT ARGUMENT MATCHING ==="]
+
+    exact_matches = 0
+    total_args = 0
+
     # Check main arguments
     for i, (ext_arg, sample_arg) in enumerate(zip(extracted, sample)):
-        ext_text = ext_arg['argument']
-        sample_text = sample_arg['argument']
-        
-        match = ext_text == sample_text
-        print(f"{i+1}. Main argument match: {'✓' if match else '✗'}")
+        ext_text = _get_argument(ext_arg)
+        sample_text = _get_argument(sample_arg)
+
+        match = _texts_match(ext_text, sample_text)
+        total_args += 1
+        exact_matches += match
+        lines.append(f"{i+1}. Main argument match: {'✓' if match else '✗'}")
         if not match:
-            print(f"   Expected: {sample_text}")
-            print(f"   Got:      {ext_text}")
-        
+            lines.append(f"   Expected: {sample_text}")
+            lines.append(f"   Got:      {ext_text}")
+
         # Check sub-arguments
-        ext_subs = ext_arg.get('sub_arguments', [])
-        sample_subs = sample_arg.get('sub_arguments', [])
-        
+        ext_subs = ext_arg.get('sub_arguments', ())
+        sample_subs = sample_arg.get('sub_arguments', ())
+
         if len(ext_subs) != len(sample_subs):
-            print(f"   Sub-arg count mismatch: expected {len(sample_subs)}, got {len(ext_subs)}")
-        
+            lines.append(f"   Sub-arg count mismatch: expected {len(sample_subs)}, got {len(ext_subs)}")
+
         for j, (ext_sub, sample_sub) in enumerate(zip(ext_subs, sample_subs)):
-            ext_sub_text = ext_sub['argument']
-            sample_sub_text = sample_sub['argument']
-            
-            sub_match = ext_sub_text == sample_sub_text
-            print(f"   {i+1}.{j+1} Sub-argument match: {'✓' if sub_match else '✗'}")
+            ext_sub_text = _get_argument(ext_sub)
+            sample_sub_text = _get_argument(sample_sub)
+
+            sub_match = _texts_match(ext_sub_text, sample_sub_text)
+            total_args += 1
+            exact_matches += sub_match
+            lines.append(f"   {i+1}.{j+1} Sub-argument match: {'✓' if sub_match else '✗'}")
             if not sub_match:
-                print(f"        Expected: {sample_sub_text}")
-                print(f"        Got:      {ext_sub_text}")
+                lines.append(f"        Expected: {sample_sub_text}")
+                lines.append(f"        Got:      {ext_sub_text}")
+
+    sys.stdout.write("\n".join(lines) + "\n")
+
+    return exact_matches, total_args
 
 def main():
     # Load both files
     extracted_path = Path("extracted_arguments_test.json")
     sample_path = Path("data/sample_data.json")
     
-    with open(extracted_path, 'r') as f:
-        extracted = json.load(f)
-    
-    with open(sample_path, 'r') as f:
-        sample = json.load(f)
+    extracted = _load_json(extracted_path)
+    sample = _load_json(sample_path)
     
     print(f"Comparing {len(extracted)} extracted vs {len(sample)} sample arguments")
     
-    # Compare exact matches
-    compare_exact_match(extracted, sample)
+    # Compare exact matches (also yields the totals, so no second walk)
+    exact_matches, total_args = compare_exact_match(extracted, sample)
     
     # Show quality metrics
     print(f"\n=== QUALITY METRICS ===")
@@ -66,21 +111,6 @@ def main():
     print(f"Petitioner count: {len(petitioner_ext)} vs {len(petitioner_sample)} {'✓' if len(petitioner_ext) == len(petitioner_sample) else '✗'}")
     print(f"Respondent count: {len(respondent_ext)} vs {len(respondent_sample)} {'✓' if len(respondent_ext) == len(respondent_sample) else '✗'}")
     
-    # Count total exact matches
-    exact_matches = 0
-    total_args = 0
-    
-    for ext_arg, sample_arg in zip(extracted, sample):
-        total_args += 1
-        if ext_arg['argument'] == sample_arg['argument']:
-            exact_matches += 1
-        
-        # Count sub-arguments
-        for ext_sub, sample_sub in zip(ext_arg.get('sub_arguments', []), sample_arg.get('sub_arguments', [])):
-            total_args += 1
-            if ext_sub['argument'] == sample_sub['argument']:
-                exact_matches += 1
-    
     match_percentage = (exact_matches / total_args) * 100 if total_args > 0 else 0
     print(f"Exact match rate: {exact_matches}/{total_args} ({match_percentage:.1f}%)")
 
@@ -4,59 +4,92 @@ Pedadog: Legal Pedagogy Analysis Package
 This package provides tools for analyzing case beliefs and character beliefs
 in legal pedagogy contexts, including distributional belief measurement
 and PDF argument extraction.
+
+Submodules are loaded lazily (PEP 562): importing pedadog costs only this
+file, and openai/numpy/yaml/dotenv are paid for the first time an
+attribute that needs them is touched.
 """
 
+import importlib
+
 __version__ = "0.1.0"
 __author__ = "Legal Pedagogy Team"
 
-from .api import extract_arguments, belief_vector
-from .case_beliefs import CaseBeliefAnalyzer
-from .character_beliefs import CharacterBeliefAnalyzer
-from .thermometer import thermo, monte_carlo_belief_of, BeliefResults, BeliefDistribution
-from .generate_belief_vector import (
-    extract_arguments_from_pdfs, 
-    generate_belief_vector_from_arguments,
-    generate_belief_vector_from_pdfs
-)
-from .make_character_questions import create_character_questions_file, load_character_questions, get_question_texts
-from .models import (
-    BaseLLM, 
-    AISandboxModel,
-    O3MiniModel,
-    MockLLM,
-    create_ai_sandbox_model,
-    create_o3_mini_model,
-    create_mock_model,
-    get_default_model,
-    set_default_llm,
-    sandbox_llm,
-    prompt_o3_mini
-)
+# Attribute name -> (module, attribute) resolved on first access
+_LAZY = {
+    "extract_arguments": ("pedadog.api", "extract_arguments"),
+    "belief_vector": ("pedadog.api", "belief_vector"),
+    "CaseBeliefAnalyzer": ("pedadog.case_beliefs", "CaseBeliefAnalyzer"),
+    "CharacterBeliefAnalyzer": ("pedadog.character_beliefs", "CharacterBeliefAnalyzer"),
+    "thermo": ("pedadog.thermometer", "thermo"),
+    "athermo": ("pedadog.thermometer", "athermo"),
+    "thermo_batched": ("pedadog.thermometer", "thermo_batched"),
+    "thermo_multi_stage": ("pedadog.thermometer", "thermo_multi_stage"),
+    "monte_carlo_belief_of": ("pedadog.thermometer", "monte_carlo_belief_of"),
+    "BeliefResults": ("pedadog.thermometer", "BeliefResults"),
+    "BeliefDistribution": ("pedadog.thermometer", "BeliefDistribution"),
+    "extract_arguments_from_pdfs": ("pedadog.generate_belief_vector", "extract_arguments_from_pdfs"),
+    "generate_belief_vector_from_arguments": ("pedadog.generate_belief_vector", "generate_belief_vector_from_arguments"),
+    "generate_belief_vector_from_pdfs": ("pedadog.generate_belief_vector", "generate_belief_vector_from_pdfs"),
+    "create_character_questions_file": ("pedadog.make_character_questions", "create_character_questions_file"),
+    "load_character_questions": ("pedadog.make_character_questions", "load_character_questions"),
+    "get_question_texts": ("pedadog.make_character_questions", "get_question_texts"),
+    "get_question_texts_list": ("pedadog.make_character_questions", "get_question_texts_list"),
+    "BaseLLM": ("pedadog.models", "BaseLLM"),
+    "AISandboxModel": ("pedadog.models", "AISandboxModel"),
+    "O3MiniModel": ("pedadog.models", "O3MiniModel"),
+    "MockLLM": ("pedadog.models", "MockLLM"),
+    "create_ai_sandbox_model": ("pedadog.models", "create_ai_sandbox_model"),
+    "create_o3_mini_model": ("pedadog.models", "create_o3_mini_model"),
+    "create_mock_model": ("pedadog.models", "create_mock_model"),
+    "get_default_model": ("pedadog.models", "get_default_model"),
+    "set_default_llm": ("pedadog.models", "set_default_llm"),
+    "sandbox_llm": ("pedadog.models", "sandbox_llm"),
+    "prompt_o3_mini": ("pedadog.models", "prompt_o3_mini"),
+}
 
 __all__ = [
     "extract_arguments",
     "belief_vector",
-    "CaseBeliefAnalyzer", 
+    "CaseBeliefAnalyzer",
     "CharacterBeliefAnalyzer",
     "thermo",
-    "monte_carlo_belief_of", 
+    "athermo",
+    "thermo_batched",
+    "thermo_multi_stage",
+    "monte_carlo_belief_of",
     "BeliefResults",
     "BeliefDistribution",
     "extract_arguments_from_pdfs",
-    "generate_belief_vector_from_arguments", 
+    "generate_belief_vector_from_arguments",
     "generate_belief_vector_from_pdfs",
     "create_character_questions_file",
     "load_character_questions",
     "get_question_texts",
+    "get_question_texts_list",
     "BaseLLM",
     "AISandboxModel",
     "O3MiniModel",
-    "MockLLM", 
+    "MockLLM",
     "create_ai_sandbox_model",
-    "create_o3_mini_model", 
+    "create_o3_mini_model",
     "create_mock_model",
     "get_default_model",
     "set_default_llm",
     "sandbox_llm",
     "prompt_o3_mini"
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value  # cache so __getattr__ only fires once per name
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
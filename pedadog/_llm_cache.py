@@ -0,0 +1,88 @@
+"""
+On-disk response memoization for LLM calls.
+
+sandbox_llm / prompt_o3_mini are pure functions of their arguments from
+the caller's perspective, so warm re-runs of the same prompts (dev
+iteration, ablations) can be served from disk instead of paying full API
+latency. Keys are blake2b digests of the full call signature; callers
+that want distinct Monte Carlo draws pass a sample_index so draws don't
+collapse onto one cached response.
+
+Entries are JSON files named by digest under CACHE_DIR (overridable via
+the PEDADOG_LLM_CACHE environment variable), fronted by an in-process
+dict so repeat hits within a run skip the disk entirely.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Optional
+
+CACHE_DIR = Path(os.environ.get("PEDADOG_LLM_CACHE", ".pedadog_llm_cache"))
+
+# In-process layer in front of the disk entries
+_memory: dict = {}
+
+
+def cache_key(
+    model: str,
+    system_prompt: str,
+    prompt: str,
+    temperature: Optional[float] = None,
+    top_p: Optional[float] = None,
+    max_tokens: Optional[int] = None,
+    sample_index: Optional[int] = None,
+) -> str:
+    """Digest the full call signature into a filesystem-safe key."""
+    payload = "\x00".join([
+        str(model),
+        str(system_prompt),
+        str(prompt),
+        "" if temperature is None else f"{round(temperature, 3)}",
+        str(top_p),
+        str(max_tokens),
+        str(sample_index),
+    ])
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+def lookup(key: str) -> Optional[str]:
+    """Return the cached response for key, or None on a miss."""
+    if key in _memory:
+        return _memory[key]
+    path = CACHE_DIR / f"{key}.json"
+    try:
+        with open(path, 'r') as f:
+            response = json.load(f)["response"]
+    except (FileNotFoundError, json.JSONDecodeError, KeyError):
+        return None
+    _memory[key] = response
+    return response
+
+
+def store(key: str, response: Any) -> None:
+    """Persist a response under key (atomic write, no expiry)."""
+    _memory[key] = response
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    path = CACHE_DIR / f"{key}.json"
+    fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump({"response": response}, f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def clear() -> None:
+    """Drop the in-process layer and delete all on-disk entries."""
+    _memory.clear()
+    if CACHE_DIR.exists():
+        for entry in CACHE_DIR.glob("*.json"):
+            entry.unlink()
@@ -1,11 +1,17 @@
+import asyncio
+import inspect
 import os
 import requests
 import json
 import base64
 from mimetypes import guess_type
-from openai import AzureOpenAI
+import httpx
+from openai import AzureOpenAI, AsyncAzureOpenAI
 from tqdm import trange, tqdm
 from dotenv import load_dotenv
+
+from . import _llm_cache
+
 load_dotenv()
 
 # Princeton's AI Sandbox - Azure endpoint for generation
@@ -39,21 +45,30 @@ def local_image_to_data_url(image_path):
     if mime_type is None:
         mime_type = "application/octet-stream"
 
-    with open(image_path, "rb") as image_file:
-        base64_encoded_data = base64.b64encode(image_file.read()).decode("utf-8")
+    # Large buffer keeps the read in few syscalls; ascii decode avoids the
+    # utf-8 validation pass (base64 output is pure ASCII)
+    with open(image_path, "rb", buffering=1 << 20) as image_file:
+        base64_encoded_data = base64.b64encode(image_file.read()).decode("ascii")
 
     return f"data:{mime_type};base64,{base64_encoded_data}"
 
-# This function will submit a simple text prompt to the chosen model
-def sandbox_llm(prompt, system_prompt = "You are a creative writing assistant. Complete the story in a compelling way.", temperature = 0.7, top_p=0.5,  max_tokens = 4096, model_to_be_used='gpt-4o'):
-    # Establish a connection to your Azure OpenAI instance
-    client = AzureOpenAI(
-        api_key=sandbox_api_key,
-        azure_endpoint = sandbox_endpoint,
-        api_version=sandbox_api_version # current api version not in preview
-    )
+async def local_image_to_data_url_async(image_path):
+    """Encode in a worker thread so multi-MB images don't block the event loop."""
+    return await asyncio.to_thread(local_image_to_data_url, image_path)
 
-    response = client.chat.completions.create(
+# This function will submit a simple text prompt to the chosen model
+def sandbox_llm(prompt, system_prompt = "You are a creative writing assistant. Complete the story in a compelling way.", temperature = 0.7, top_p=0.5,  max_tokens = 4096, model_to_be_used='gpt-4o', sample_index=None):
+    # Warm re-runs of identical calls come straight from the on-disk
+    # cache; pass distinct sample_index values to keep Monte Carlo draws
+    # from collapsing onto one cached response
+    key = _llm_cache.cache_key(model_to_be_used, system_prompt, prompt,
+                               temperature, top_p, max_tokens, sample_index)
+    cached = _llm_cache.lookup(key)
+    if cached is not None:
+        return cached
+
+    # Reuses the module-level client (and its keep-alive connections)
+    response = _client.chat.completions.create(
         model=model_to_be_used,
         temperature=temperature, # temperature = how creative/random the model is in generating response - 0 to 1 with 1 being most creative
         max_tokens=max_tokens, # max_tokens = token limit on context to send to the model - no stories should realistically exceed this
@@ -63,9 +78,103 @@ def sandbox_llm(prompt, system_prompt = "You are a creative writing assistant. C
             {"role": "user", "content": prompt}, # user prompt
         ]
     )
+    content = response.choices[0].message.content
+    _llm_cache.store(key, content)
+    return content
+
+# Dedicated jitter source: keeps retry backoff off the random module's
+# shared global state (a lock point under thread pools)
+import random as _random
+_JITTER = _random.Random()
+
+# One sync client for the whole module, reused across calls: rebuilding
+# AzureOpenAI per call re-ran client init and a TCP+TLS handshake for
+# every Monte Carlo sample. The pool is sized to match the concurrency
+# used by the async batching helpers.
+_client = AzureOpenAI(
+    api_key=sandbox_api_key,
+    azure_endpoint=sandbox_endpoint,
+    api_version=sandbox_api_version,
+    http_client=httpx.Client(
+        limits=httpx.Limits(max_connections=64, max_keepalive_connections=32)
+    )
+)
+
+# One async client for the whole module: the Monte Carlo loops are pure
+# I/O-wait, so fanning requests out over this shared connection pool with
+# asyncio.gather turns N sequential round-trips into ~N/concurrency
+_async_client = AsyncAzureOpenAI(
+    api_key=sandbox_api_key,
+    azure_endpoint=sandbox_endpoint,
+    api_version=sandbox_api_version
+)
+
+async def sandbox_llm_async(prompt, system_prompt = "You are a creative writing assistant. Complete the story in a compelling way.", temperature = 0.7, top_p=0.5,  max_tokens = 4096, model_to_be_used='gpt-4o'):
+    """Async counterpart to sandbox_llm, sharing the module-level client."""
+    response = await _async_client.chat.completions.create(
+        model=model_to_be_used,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        top_p=top_p,
+        messages=[
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": prompt},
+        ]
+    )
     return response.choices[0].message.content
 
-def prompt_o3_mini(prompt, system_prompt="", model_to_be_used="o3-mini")->str:
+async def prompt_o3_mini_async(prompt, system_prompt="", model_to_be_used="o3-mini")->str:
+    """Async counterpart to prompt_o3_mini with the same backoff policy."""
+    import logging
+
+    logger = logging.getLogger(__name__)
+    max_retries = 5
+    base_delay = 1
+
+    for attempt in range(max_retries):
+        try:
+            response = await _async_client.chat.completions.create(
+                model=model_to_be_used,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": prompt},
+                ]
+            )
+            return response.choices[0].message.content
+
+        except Exception as e:
+            delay = base_delay * (1 << attempt) + _JITTER.random()
+
+            if attempt < max_retries - 1:
+                logger.warning(f"Attempt {attempt + 1} failed with error: {str(e)}. Retrying in {delay:.2f} seconds...")
+                await asyncio.sleep(delay)
+            else:
+                logger.error(f"All {max_retries} attempts failed. Last error: {str(e)}")
+                raise Exception(f"Failed to get response after {max_retries} attempts") from e
+
+async def gather_prompts(prompts, llm_async=None, max_concurrency=32, **kwargs):
+    """Fan a batch of prompts out concurrently, bounded by a semaphore.
+
+    Args:
+        prompts: Iterable of prompt strings
+        llm_async: Async prompt function (defaults to sandbox_llm_async)
+        max_concurrency: Maximum number of in-flight requests
+        **kwargs: Forwarded to the prompt function
+
+    Returns:
+        List of responses in prompt order
+    """
+    if llm_async is None:
+        llm_async = sandbox_llm_async
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def bound(p):
+        async with semaphore:
+            return await llm_async(p, **kwargs)
+
+    return await asyncio.gather(*[bound(p) for p in prompts])
+
+def prompt_o3_mini(prompt, system_prompt="", model_to_be_used="o3-mini", sample_index=None)->str:
     """
     Submit a text prompt to the chosen model with retry logic and exponential backoff.
 
@@ -81,7 +190,6 @@ def prompt_o3_mini(prompt, system_prompt="", model_to_be_used="o3-mini")->str:
         The generated text response as a string
     """
     import time
-    import random
     import logging
 
     # Initialize logging
@@ -91,27 +199,29 @@ def prompt_o3_mini(prompt, system_prompt="", model_to_be_used="o3-mini")->str:
     max_retries = 5
     base_delay = 1  # Base delay in seconds
 
-    # Establish a connection to Azure OpenAI
-    client = AzureOpenAI(
-        api_key=sandbox_api_key,
-        azure_endpoint=sandbox_endpoint,
-        api_version=sandbox_api_version
-    )
+    # Same on-disk memoization as sandbox_llm
+    key = _llm_cache.cache_key(model_to_be_used, system_prompt, prompt,
+                               sample_index=sample_index)
+    cached = _llm_cache.lookup(key)
+    if cached is not None:
+        return cached
 
     for attempt in range(max_retries):
         try:
-            response = client.chat.completions.create(
+            response = _client.chat.completions.create(
                 model=model_to_be_used,
                 messages=[
                     {"role": "system", "content": system_prompt},
                     {"role": "user", "content": prompt},
                 ]
             )
-            return response.choices[0].message.content
+            content = response.choices[0].message.content
+            _llm_cache.store(key, content)
+            return content
 
         except Exception as e:
             # Calculate backoff delay with jitter
-            delay = base_delay * (2 ** attempt) + random.uniform(0, 1)
+            delay = base_delay * (1 << attempt) + _JITTER.random()
 
             if attempt < max_retries - 1:
                 logger.warning(f"Attempt {attempt + 1} failed with error: {str(e)}. Retrying in {delay:.2f} seconds...")
@@ -149,10 +259,23 @@ def llm_sample_to_length(llm, prompt, target_length, tolerance=0.1, max_tries=10
     closest_distance = float('inf')
     consecutive_errors = 0
 
+    # Resampling only works if each attempt is a fresh draw: sandbox_llm
+    # and prompt_o3_mini memoize on disk keyed by their arguments, so a
+    # bare llm(prompt) would return the identical cached string every
+    # retry and the loop could never converge. Callables accepting
+    # sample_index get the attempt number as the cache nonce.
+    try:
+        varies_per_attempt = "sample_index" in inspect.signature(llm).parameters
+    except (TypeError, ValueError):
+        varies_per_attempt = False
+
     for attempt in trange(max_tries):
         try:
             # Generate text using the provided LLM function
-            generated_text = llm(prompt)
+            if varies_per_attempt:
+                generated_text = llm(prompt, sample_index=attempt)
+            else:
+                generated_text = llm(prompt)
 
             # Reset error counter on successful API call
             consecutive_errors = 0
@@ -162,8 +285,9 @@ def llm_sample_to_length(llm, prompt, target_length, tolerance=0.1, max_tries=10
                 logger.warning(f"Attempt {attempt+1}: LLM returned empty response, retrying...")
                 continue
 
-            # Calculate the length of the generated text
-            text_length = len(generated_text.split(" "))
+            # Calculate the length of the generated text (space count + 1
+            # equals len(split(" ")) without allocating the list)
+            text_length = generated_text.count(' ') + 1
 
             # Check if the text is within the acceptable range
             if min_length <= text_length <= max_length:
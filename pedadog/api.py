@@ -6,22 +6,29 @@ Functions which expose core functionality of pedadog in two API calls
 2. belief_vector(arguments_json, *justice_callable): takes a hierarchical list of arguments, combines with built-in character attributes, and returns a list of 'belief distributions' per argument, per justice. 
 
 """
+import asyncio
 import json
 import yaml
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 import numpy as np
 
 from .generate_belief_vector import extract_arguments_from_pdfs
 from .models import AISandboxModel
-from .thermometer import thermo, BeliefResults
+from .thermometer import thermo, athermo, BeliefResults
 
 
+# C-backed loader when libyaml is present (~3x faster parse)
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@lru_cache(maxsize=1)
 def _load_config() -> dict:
-    """Load configuration from config.yaml."""
+    """Load configuration from config.yaml (parsed once per process)."""
     config_path = Path(__file__).parent / "config.yaml"
     with config_path.open() as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=_YAML_LOADER)
 
 def extract_arguments(
         pdf_petitioner:Path, 
@@ -70,7 +77,13 @@ def belief_vector(
     # Load templates from config
     config = _load_config()
     prompts = config["prompts"]
-    
+
+    # Bound format methods hoisted out of the loops so the format spec
+    # isn't re-parsed per argument
+    _fmt_main = prompts["argument_belief_template"].format
+    _fmt_sub = prompts["sub_argument_belief_template"].format
+    _fmt_char = prompts["character_assessment_template"].format
+
     # Prepare questions from arguments
     questions = []
 
@@ -78,57 +91,39 @@ def belief_vector(
     for arg in all_arguments:
         # Add main argument as a question
         arg_type = arg.get("type", "unknown")
-        main_arg = prompts["argument_belief_template"].format(
-            arg_type=arg_type,
-            argument_text=arg["argument"]
-        )
-        questions.append(main_arg)
+        questions.append(_fmt_main(arg_type=arg_type, argument_text=arg["argument"]))
 
         # Add sub-arguments if they exist
-        if arg.get("sub_arguments"):
-            for sub_arg in arg["sub_arguments"]:
-                if isinstance(sub_arg, dict) and "argument" in sub_arg:
-                    sub_arg_text = prompts["sub_argument_belief_template"].format(
-                        arg_type=arg_type,
-                        sub_argument_text=sub_arg["argument"]
-                    )
-                    questions.append(sub_arg_text)
-                elif isinstance(sub_arg, str):
-                    sub_arg_text = prompts["sub_argument_belief_template"].format(
-                        arg_type=arg_type,
-                        sub_argument_text=sub_arg
-                    )
-                    questions.append(sub_arg_text)
-    
+        for sub_arg in arg.get("sub_arguments") or ():
+            if isinstance(sub_arg, dict) and "argument" in sub_arg:
+                questions.append(_fmt_sub(arg_type=arg_type,
+                                          sub_argument_text=sub_arg["argument"]))
+            elif isinstance(sub_arg, str):
+                questions.append(_fmt_sub(arg_type=arg_type,
+                                          sub_argument_text=sub_arg))
+
     # Add character assessment questions from config or file
-    character_template = prompts["character_assessment_template"]
-    
+
     # First try to use character attributes from config
     if "character_attributes" in config:
-        for attribute in config["character_attributes"]:
-            character_question = character_template.format(
-                attribute_text=attribute
-            )
-            questions.append(character_question)
-    
+        questions.extend(_fmt_char(attribute_text=attribute)
+                         for attribute in config["character_attributes"])
+
     # If path_to_character_rubric is provided, use that as fallback/override
     elif path_to_character_rubric:
         try:
-            # Load character rubric (text file with one attribute per line)
+            # Load character rubric (text file with one attribute per line,
+            # skipping blanks and comments)
             rubric_path = Path(path_to_character_rubric)
             with rubric_path.open() as f:
                 rubric_lines = f.readlines()
-            
-            # Create questions for each rubric item using config template
-            for line in rubric_lines:
-                line = line.strip()
-                if line and not line.startswith("#"):  # Skip empty lines and comments
-                    # Format the question using the template from config
-                    character_question = character_template.format(
-                        attribute_text=line
-                    )
-                    questions.append(character_question)
-                    
+
+            questions.extend(
+                _fmt_char(attribute_text=line)
+                for line in map(str.strip, rubric_lines)
+                if line and not line.startswith("#")
+            )
+
         except (FileNotFoundError, IOError) as e:
             print(f"Warning: Could not load character rubric: {e}")
             # Continue without character questions if rubric can't be loaded
@@ -137,33 +132,39 @@ def belief_vector(
     if not judge_callables:
         return []
 
-    # Run thermometer with all judges and questions
-    belief_results = thermo(
+    # Run the thermometer asynchronously: the whole questions x judges x
+    # n_samples Cartesian is network-bound, so fanning it out under
+    # athermo's semaphore cuts wall time to ~one round-trip per
+    # concurrency slot. The public signature stays synchronous.
+    belief_results = asyncio.run(athermo(
         questions=questions,
         context=context,
         models=list(judge_callables),
         n_samples=n_samples,
         min_val=0.0,
-        max_val=1.0
-    )
-
-    # Convert BeliefResults to the expected format
-    # Return a list of dictionaries, one per judge
-    belief_distribution_list = []
-
-    for judge in judge_callables:
+        max_val=1.0,
+        max_concurrency=32
+    ))
+
+    # Convert BeliefResults to the expected format: one contiguous float64
+    # buffer for every sampled value, sliced into zero-copy views per
+    # (judge, question). Building thousands of tiny np.array objects paid
+    # PyObject->float conversion and allocator overhead per question;
+    # a single typed sweep pays it once.
+    flat_values: List[float] = []
+    spans = []  # (judge_index, question, start, stop) into flat_values
+    for judge_index, judge in enumerate(judge_callables):
         judge_name = getattr(judge, "name", str(judge))
-        judge_beliefs = {}
-
-        # Get all results for this judge
-        judge_results = belief_results.get_model_results(judge_name)
+        for question, distribution in belief_results.get_model_results(judge_name).items():
+            values = distribution.values
+            spans.append((judge_index, question, len(flat_values),
+                          len(flat_values) + len(values)))
+            flat_values.extend(values)
 
-        # Convert each question's distribution to numpy array
-        for question, distribution in judge_results.items():
-            # Get the numeric values as a numpy array
-            values = np.array(distribution.values)
-            judge_beliefs[question] = values
+    buffer = np.fromiter(flat_values, dtype=np.float64, count=len(flat_values))
 
-        belief_distribution_list.append(judge_beliefs)
+    belief_distribution_list: List[Dict[str, Any]] = [{} for _ in judge_callables]
+    for judge_index, question, start, stop in spans:
+        belief_distribution_list[judge_index][question] = buffer[start:stop]
 
     return belief_distribution_list
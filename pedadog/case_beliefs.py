@@ -10,19 +10,39 @@ import argparse
 from typing import Dict, List, Any
 from pathlib import Path
 
+import numpy as np
+
+try:
+    import orjson  # C-backed parser, ~2-5x faster on multi-MB dumps
+except ModuleNotFoundError:
+    orjson = None
+
 
 class CaseBeliefAnalyzer:
     """Analyzer for case-related beliefs in legal pedadog."""
-    
+
     def __init__(self):
         self.cases = []
         self.beliefs = {}
-    
+        self._types = np.array([], dtype=object)
+        self._argument_lengths = np.array([], dtype=np.int32)
+
     def load_case_data(self, data_path: Path) -> None:
         """Load case data from JSON file."""
-        with open(data_path, 'r') as f:
-            self.cases = json.load(f)
-    
+        if orjson is not None:
+            self.cases = orjson.loads(Path(data_path).read_bytes())
+        else:
+            with open(data_path, 'r') as f:
+                self.cases = json.load(f)
+        # Columnar (structure-of-arrays) views built once at load time:
+        # aggregations run as single numpy ops instead of per-row dict
+        # access, and the numeric columns are ready for compiled kernels
+        self._types = np.array([c.get('type', '') for c in self.cases])
+        self._argument_lengths = np.fromiter(
+            (len(c.get('argument', '')) for c in self.cases),
+            dtype=np.int32, count=len(self.cases)
+        )
+
     def analyze_beliefs(self) -> Dict[str, Any]:
         """Analyze beliefs about legal cases."""
         analysis = {
@@ -33,9 +53,11 @@ class CaseBeliefAnalyzer:
         return analysis
     
     def _extract_belief_patterns(self) -> Dict[str, int]:
-        """Extract patterns in case beliefs."""
-        # Placeholder implementation
-        return {"placeholder_pattern": 1}
+        """Extract patterns in case beliefs (counts per argument type)."""
+        if self._types.size == 0:
+            return {"placeholder_pattern": 1}
+        types, counts = np.unique(self._types, return_counts=True)
+        return {str(t): int(c) for t, c in zip(types, counts)}
     
     def _identify_common_themes(self) -> List[str]:
         """Identify common themes in case beliefs."""
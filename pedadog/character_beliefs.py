@@ -10,18 +10,32 @@ import argparse
 from typing import Dict, List, Any
 from pathlib import Path
 
+import numpy as np
+
+try:
+    import orjson  # C-backed parser, ~2-5x faster on multi-MB dumps
+except ModuleNotFoundError:
+    orjson = None
+
 
 class CharacterBeliefAnalyzer:
     """Analyzer for character-related beliefs in legal pedadog."""
-    
+
     def __init__(self):
         self.characters = []
         self.beliefs = {}
-    
+        self._types = np.array([], dtype=object)
+
     def load_character_data(self, data_path: Path) -> None:
         """Load character data from JSON file."""
-        with open(data_path, 'r') as f:
-            self.characters = json.load(f)
+        if orjson is not None:
+            self.characters = orjson.loads(Path(data_path).read_bytes())
+        else:
+            with open(data_path, 'r') as f:
+                self.characters = json.load(f)
+        # Columnar view over the role/type field so categorization is a
+        # single np.unique instead of a Python loop over dicts
+        self._types = np.array([c.get('type', '') for c in self.characters])
     
     def analyze_beliefs(self) -> Dict[str, Any]:
         """Analyze beliefs about legal characters."""
@@ -35,13 +49,16 @@ class CharacterBeliefAnalyzer:
     
     def _categorize_characters(self) -> Dict[str, int]:
         """Categorize characters by role in legal system."""
-        # Placeholder implementation
-        return {
+        categories = {
             "judges": 0,
             "lawyers": 0,
             "defendants": 0,
             "witnesses": 0
         }
+        if self._types.size:
+            types, counts = np.unique(self._types, return_counts=True)
+            categories.update({str(t): int(c) for t, c in zip(types, counts)})
+        return categories
     
     def _analyze_belief_distribution(self) -> Dict[str, float]:
         """Analyze distribution of beliefs about characters."""
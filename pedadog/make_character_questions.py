@@ -6,9 +6,37 @@ about character attributes for belief measurement.
 """
 
 import json
-from typing import List, Dict, Any
+import mmap
+import os
+import string
+from dataclasses import asdict, dataclass
+from typing import Iterator, List, Dict, Any, Union
 from pathlib import Path
 
+try:
+    import orjson  # C-backed encoder, ~3-10x faster than stdlib json
+except ModuleNotFoundError:
+    orjson = None
+
+try:
+    import msgpack  # binary serialization, smaller and faster than JSON
+except ModuleNotFoundError:
+    msgpack = None
+
+
+@dataclass(slots=True, frozen=True)
+class CharacterQuestion:
+    """One generated character question with its metadata.
+
+    Slots keep per-question memory at fixed fields instead of a dict,
+    which matters when rubrics grow to hundreds of attributes.
+    """
+    id: int
+    attribute: str
+    question: str
+    category: str = "character"
+    type: str = "appellant_character"
+
 
 def load_rubric_attributes(rubric_path: Path) -> List[str]:
     """
@@ -20,10 +48,33 @@ def load_rubric_attributes(rubric_path: Path) -> List[str]:
     Returns:
         List of attribute strings
     """
+    rubric_path = Path(rubric_path)
     try:
-        with open(rubric_path, 'r', encoding='utf-8') as f:
-            attributes = [line.strip() for line in f if line.strip()]
-        return attributes
+        # Small-file fast path: mmap setup only pays off above a page
+        if rubric_path.stat().st_size < 4096:
+            text = rubric_path.read_text(encoding='utf-8')
+            return [line.strip() for line in text.splitlines() if line.strip()]
+        # Large rubrics: walk the mapped bytes directly and decode only
+        # the non-empty lines, skipping the whole-file str copy
+        with open(rubric_path, 'rb') as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                attributes = []
+                append = attributes.append
+                find = mm.find
+                size = mm.size()
+                pos = 0
+                while pos < size:
+                    newline = find(b'\n', pos)
+                    if newline == -1:
+                        newline = size
+                    line = mm[pos:newline]
+                    if line.strip():
+                        append(line.decode('utf-8').strip())
+                    pos = newline + 1
+                return attributes
+            finally:
+                mm.close()
     except FileNotFoundError:
         raise FileNotFoundError(f"Rubric file not found: {rubric_path}")
     except Exception as e:
@@ -41,9 +92,7 @@ def load_question_template(template_path: Path) -> str:
         Template string containing ATTRIBUTE_TEXT placeholder
     """
     try:
-        with open(template_path, 'r', encoding='utf-8') as f:
-            template = f.read().strip()
-        return template
+        return Path(template_path).read_text(encoding='utf-8').strip()
     except FileNotFoundError:
         raise FileNotFoundError(f"Template file not found: {template_path}")
     except Exception as e:
@@ -53,51 +102,49 @@ def load_question_template(template_path: Path) -> str:
 def generate_character_questions(
     attributes: List[str],
     template: str
-) -> List[Dict[str, Any]]:
+) -> List[CharacterQuestion]:
     """
     Generate character questions by substituting attributes into template.
-    
+
     Args:
         attributes: List of attribute strings
         template: Question template with ATTRIBUTE_TEXT placeholder
-        
+
     Returns:
-        List of question dictionaries with metadata
+        List of CharacterQuestion records
     """
-    questions = []
-    
-    for i, attribute in enumerate(attributes):
-        # Replace ATTRIBUTE_TEXT with the actual attribute
-        question_text = template.replace("ATTRIBUTE_TEXT", attribute)
-        
-        question_data = {
-            "id": i,
-            "attribute": attribute,
-            "question": question_text,
-            "category": "character",
-            "type": "appellant_character"
-        }
-        
-        questions.append(question_data)
-    
-    return questions
+    # Precompile the template once: the ATTRIBUTE_TEXT convention is
+    # rewritten to string.Template syntax (literal $ escaped first) and
+    # substitution is bound to a local, so each question is one call
+    # instead of re-scanning the template per attribute
+    if "ATTRIBUTE_TEXT" not in template:
+        raise ValueError("Question template is missing the ATTRIBUTE_TEXT placeholder")
+
+    substitute = string.Template(
+        template.replace("$", "$$").replace("ATTRIBUTE_TEXT", "${attribute}")
+    ).substitute
+
+    return [
+        CharacterQuestion(id=i, attribute=attribute, question=substitute(attribute=attribute))
+        for i, attribute in enumerate(attributes)
+    ]
 
 
 def create_character_questions_file(
     rubric_path: Path,
     template_path: Path,
     output_path: Path
-) -> List[Dict[str, Any]]:
+) -> List[CharacterQuestion]:
     """
     Complete pipeline: load rubric and template, generate questions, save to file.
-    
+
     Args:
         rubric_path: Path to moot_rubric.txt
         template_path: Path to character_attribute_question.txt
         output_path: Path to save generated questions JSON
-        
+
     Returns:
-        List of generated question dictionaries
+        List of generated CharacterQuestion records
     """
     print(f"Loading attributes from {rubric_path}")
     attributes = load_rubric_attributes(rubric_path)
@@ -111,10 +158,31 @@ def create_character_questions_file(
     questions = generate_character_questions(attributes, template)
     print(f"Generated {len(questions)} questions")
     
-    # Save to output file
+    # Save to output file (as plain dicts, so on-disk records and
+    # load_character_questions round-trips are unchanged). A .msgpack
+    # suffix selects binary MessagePack output; anything else gets JSON.
     print(f"Saving questions to {output_path}")
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(questions, f, indent=2)
+    records = [asdict(q) for q in questions]
+    output_path = Path(output_path)
+    if output_path.suffix == ".msgpack":
+        if msgpack is None:
+            raise ValueError(
+                "msgpack is not installed; use a .json output path or install msgpack"
+            )
+        payload = msgpack.packb(records, use_bin_type=True)
+    elif orjson is not None:
+        payload = orjson.dumps(records, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(records, indent=2).encode('utf-8')
+
+    # Serialize to one bytes blob, then write through a raw descriptor:
+    # open()'s TextIOWrapper/BufferedWriter stack adds two buffer layers
+    # and extra syscalls in front of what is a single write
+    fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, payload)
+    finally:
+        os.close(fd)
     
     print("Character questions generated successfully")
     return questions
@@ -122,35 +190,75 @@ def create_character_questions_file(
 
 def load_character_questions(questions_path: Path) -> List[Dict[str, Any]]:
     """
-    Load previously generated character questions from JSON file.
-    
+    Load previously generated character questions from JSON or MessagePack file.
+
     Args:
-        questions_path: Path to the questions JSON file
-        
+        questions_path: Path to the questions file (.json or .msgpack)
+
     Returns:
         List of question dictionaries
     """
+    questions_path = Path(questions_path)
+    if questions_path.suffix == ".msgpack" and msgpack is None:
+        raise ValueError(
+            "msgpack is not installed; cannot read .msgpack question files"
+        )
     try:
+        if questions_path.suffix == ".msgpack":
+            return msgpack.unpackb(questions_path.read_bytes(), raw=False)
+        if orjson is not None:
+            # Feed the parser a mapped view of the file: orjson reads the
+            # bytes in place, skipping the read_bytes() heap copy
+            with open(questions_path, 'rb') as f:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                try:
+                    return orjson.loads(memoryview(mm))
+                finally:
+                    mm.close()
         with open(questions_path, 'r', encoding='utf-8') as f:
-            questions = json.load(f)
-        return questions
+            return json.load(f)
     except FileNotFoundError:
         raise FileNotFoundError(f"Questions file not found: {questions_path}")
-    except json.JSONDecodeError as e:
+    except (json.JSONDecodeError, ValueError) as e:
         raise ValueError(f"Invalid JSON in questions file: {str(e)}")
 
 
-def get_question_texts(questions: List[Dict[str, Any]]) -> List[str]:
+def get_question_texts(
+    questions: List[Union[CharacterQuestion, Dict[str, Any]]]
+) -> Iterator[str]:
     """
-    Extract just the question text strings from question dictionaries.
-    
+    Yield the question text strings from question records.
+
+    Accepts both CharacterQuestion records (from generation) and plain
+    dictionaries (from load_character_questions). Returns a generator so
+    single-pass consumers never materialize a second list of texts; use
+    get_question_texts_list when random access or re-iteration is needed.
+
     Args:
-        questions: List of question dictionaries
-        
+        questions: List of question records or dictionaries
+
+    Returns:
+        Generator of question text strings
+    """
+    return (
+        q["question"] if isinstance(q, dict) else q.question
+        for q in questions
+    )
+
+
+def get_question_texts_list(
+    questions: List[Union[CharacterQuestion, Dict[str, Any]]]
+) -> List[str]:
+    """
+    Extract question texts as a list, for callers that need random access.
+
+    Args:
+        questions: List of question records or dictionaries
+
     Returns:
         List of question text strings
     """
-    return [q["question"] for q in questions]
+    return list(get_question_texts(questions))
 
 
 # CLI function for Snakemake integration
@@ -191,7 +299,7 @@ def main():
         
         print(f"\nGenerated {len(questions)} character questions:")
         for q in questions[:3]:  # Show first 3 as examples
-            print(f"  - {q['attribute']}: {q['question'][:100]}...")
+            print(f"  - {q.attribute}: {q.question[:100]}...")
         
         if len(questions) > 3:
             print(f"  ... and {len(questions) - 3} more")
@@ -5,17 +5,31 @@ This module provides standardized interfaces for different LLM providers
 to work with the thermometer and belief measurement systems.
 """
 
+import asyncio
+import functools
+import itertools
 import os
+import re
 import time
 import random
 import logging
-from typing import Optional, Dict, Any
+import weakref
+from typing import List, Optional, Dict, Any
 from abc import ABC, abstractmethod
-from openai import AzureOpenAI
+import httpx
+from openai import (
+    AsyncAzureOpenAI,
+    AuthenticationError,
+    AzureOpenAI,
+    BadRequestError,
+    RateLimitError,
+)
 from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+# Load environment variables. The .env scan walks the filesystem, so
+# allow callers that manage their own environment to skip it entirely.
+if os.getenv("PEDADOG_SKIP_DOTENV") != "1":
+    load_dotenv()
 
 # Princeton AI Sandbox configuration
 SANDBOX_API_KEY = os.environ.get('AI_SANDBOX_KEY')
@@ -37,6 +51,75 @@ AVAILABLE_MODELS = [
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Errors no amount of retrying will fix (bad request, bad credentials):
+# surface them immediately instead of burning the full exponential
+# backoff schedule (~31s across five attempts) on a caller mistake.
+_FATAL_ERRORS = (BadRequestError, AuthenticationError, ValueError)
+
+# Precomputed cyclic jitter table: backoff only needs decorrelated noise,
+# not fresh randomness, so a table lookup replaces a Mersenne Twister
+# draw (and its shared-state lock traffic when parallel workers retry
+# simultaneously). itertools.count() advances atomically under the GIL.
+_JITTER = tuple(random.random() for _ in range(64))
+_jitter_idx = itertools.count()
+
+
+def _retry_delay(e: Exception, attempt: int, base_delay: float = 1) -> float:
+    """Backoff delay for a retriable error, honoring Retry-After when sent."""
+    delay = base_delay * (2 ** attempt) + _JITTER[next(_jitter_idx) & 63]
+    if isinstance(e, RateLimitError):
+        headers = getattr(getattr(e, "response", None), "headers", None)
+        retry_after = headers.get("retry-after") if headers else None
+        if retry_after:
+            try:
+                delay = max(delay, float(retry_after))
+            except ValueError:
+                pass  # date-format Retry-After; keep the computed backoff
+    return delay
+
+
+# One client per API key, shared across every model instance: a fresh
+# AzureOpenAI per instance (or per legacy-wrapper call) paid client init
+# plus a TCP+TLS handshake on first use, where the shared pool keeps
+# connections alive between calls.
+@functools.lru_cache(maxsize=8)
+def _get_client(api_key: str) -> AzureOpenAI:
+    """Return the shared sync client for an API key."""
+    return AzureOpenAI(
+        api_key=api_key,
+        azure_endpoint=SANDBOX_ENDPOINT,
+        api_version=SANDBOX_API_VERSION,
+        http_client=httpx.Client(
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32)
+        )
+    )
+
+
+# Async clients are cached per event loop rather than globally: httpx
+# binds its connection pool to the loop it first runs on, so one client
+# reused across successive asyncio.run() calls fails with "Event loop
+# is closed" on the second run. Keying a WeakKeyDictionary on the loop
+# lets a finished loop's clients be collected along with it.
+_ASYNC_CLIENTS: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def _get_async_client(api_key: str) -> AsyncAzureOpenAI:
+    """Return the async client shared within the running event loop."""
+    loop = asyncio.get_running_loop()
+    per_loop = _ASYNC_CLIENTS.get(loop)
+    if per_loop is None:
+        per_loop = {}
+        _ASYNC_CLIENTS[loop] = per_loop
+    client = per_loop.get(api_key)
+    if client is None:
+        client = AsyncAzureOpenAI(
+            api_key=api_key,
+            azure_endpoint=SANDBOX_ENDPOINT,
+            api_version=SANDBOX_API_VERSION
+        )
+        per_loop[api_key] = client
+    return client
+
 
 class BaseLLM(ABC):
     """Base class for LLM model wrappers."""
@@ -44,20 +127,101 @@ class BaseLLM(ABC):
     def __init__(self, name: str, **kwargs):
         self.name = name
         self.config = kwargs
-    
+
+    def _call_with_retry(self, fn, label: str = ""):
+        """Run a zero-argument API call under the shared retry policy.
+
+        One implementation of the backoff loop instead of a copy per
+        provider method: fatal errors propagate immediately, everything
+        else backs off via _retry_delay. `label` only flavors the logs.
+        """
+        max_retries = getattr(self, "max_retries", 5)
+        base_delay = 1
+        prefix = f"{label} attempt" if label else "Attempt"
+
+        for attempt in range(max_retries):
+            try:
+                return fn()
+            except _FATAL_ERRORS:
+                raise
+            except Exception as e:
+                delay = _retry_delay(e, attempt, base_delay)
+
+                if attempt < max_retries - 1:
+                    logger.warning(f"{prefix} {attempt + 1} failed with error: {str(e)}. Retrying in {delay:.2f} seconds...")
+                    time.sleep(delay)
+                else:
+                    logger.error(f"All {max_retries} attempts failed. Last error: {str(e)}")
+                    raise RuntimeError(f"Failed to get response after {max_retries} attempts") from e
+
+    async def _acall_with_retry(self, fn, label: str = "async"):
+        """Async counterpart to _call_with_retry for awaitable-returning fn."""
+        max_retries = getattr(self, "max_retries", 5)
+        base_delay = 1
+        prefix = f"{label} attempt" if label else "Attempt"
+
+        for attempt in range(max_retries):
+            try:
+                return await fn()
+            except _FATAL_ERRORS:
+                raise
+            except Exception as e:
+                delay = _retry_delay(e, attempt, base_delay)
+
+                if attempt < max_retries - 1:
+                    logger.warning(f"{prefix} {attempt + 1} failed with error: {str(e)}. Retrying in {delay:.2f} seconds...")
+                    await asyncio.sleep(delay)
+                else:
+                    logger.error(f"All {max_retries} attempts failed. Last error: {str(e)}")
+                    raise RuntimeError(f"Failed to get response after {max_retries} attempts") from e
+
     @abstractmethod
     def prompt(self, text: str) -> str:
         """
         Send a prompt to the model and return the response.
-        
+
         Args:
             text: Input prompt text
-            
+
         Returns:
             Model response as string
         """
         pass
 
+    def prompt_n(self, text: str, n: int = 1) -> list:
+        """
+        Draw n i.i.d. samples for the same prompt.
+
+        Subclasses backed by APIs with native multi-sampling (OpenAI `n=`)
+        override this to share a single prefill across all samples; the
+        default just loops over prompt().
+
+        Args:
+            text: Input prompt text
+            n: Number of samples to draw
+
+        Returns:
+            List of n response strings
+        """
+        return [self.prompt(text) for _ in range(n)]
+
+    def prompt_many(self, texts: List[str], max_concurrency: int = 16) -> List[str]:
+        """
+        Send several distinct prompts and return their responses in order.
+
+        Subclasses with an async client override this to dispatch the
+        requests concurrently, so wall time is bounded by the slowest
+        response instead of the sum of latencies; the default loops.
+
+        Args:
+            texts: Input prompt texts
+            max_concurrency: Maximum number of in-flight requests
+
+        Returns:
+            List of responses, one per prompt, in input order
+        """
+        return [self.prompt(text) for text in texts]
+
 
 class AISandboxModel(BaseLLM):
     """Wrapper for Princeton AI Sandbox models."""
@@ -84,12 +248,8 @@ class AISandboxModel(BaseLLM):
         if not self.api_key:
             raise ValueError("AI_SANDBOX_KEY must be provided or set as environment variable")
         
-        self.client = AzureOpenAI(
-            api_key=self.api_key,
-            azure_endpoint=SANDBOX_ENDPOINT,
-            api_version=SANDBOX_API_VERSION
-        )
-        
+        self.client = _get_client(self.api_key)
+
         # Model parameters
         self.system_prompt = system_prompt
         self.temperature = temperature
@@ -97,35 +257,87 @@ class AISandboxModel(BaseLLM):
         self.max_tokens = max_tokens
         self.max_retries = max_retries
     
-    def prompt(self, text: str) -> str:
+    def _completion_params(
+        self,
+        text: str,
+        system_prefix: Optional[str] = None,
+        **extra
+    ) -> Dict[str, Any]:
+        """Assemble the chat-completions payload for this model's settings."""
+        messages = [{"role": "system", "content": self.system_prompt}]
+        if system_prefix:
+            # Shared context rides in its own system message ahead of the
+            # per-question user turn, so the provider sees a byte-identical
+            # prefix across samples and questions and can serve the
+            # context prefill from its prompt cache instead of redoing it
+            messages.append({"role": "system", "content": system_prefix})
+        messages.append({"role": "user", "content": text})
+
+        params = dict(
+            model=self.name,
+            temperature=self.temperature,
+            max_tokens=self.max_tokens,
+            top_p=self.top_p,
+            messages=messages
+        )
+        params.update(extra)
+        return params
+
+    def prompt(self, text: str, system_prefix: Optional[str] = None) -> str:
         """Send prompt to AI Sandbox and return response with retry logic."""
-        base_delay = 1  # Base delay in seconds
-        
-        for attempt in range(self.max_retries):
-            try:
-                response = self.client.chat.completions.create(
-                    model=self.name,
-                    temperature=self.temperature,
-                    max_tokens=self.max_tokens,
-                    top_p=self.top_p,
-                    messages=[
-                        {"role": "system", "content": self.system_prompt},
-                        {"role": "user", "content": text},
-                    ]
-                )
-                
-                return response.choices[0].message.content
-                
-            except Exception as e:
-                # Calculate backoff delay with jitter
-                delay = base_delay * (2 ** attempt) + random.uniform(0, 1)
-                
-                if attempt < self.max_retries - 1:
-                    logger.warning(f"Attempt {attempt + 1} failed with error: {str(e)}. Retrying in {delay:.2f} seconds...")
-                    time.sleep(delay)
-                else:
-                    logger.error(f"All {self.max_retries} attempts failed. Last error: {str(e)}")
-                    raise RuntimeError(f"Failed to get response after {self.max_retries} attempts") from e
+        def call():
+            response = self.client.chat.completions.create(
+                **self._completion_params(text, system_prefix=system_prefix)
+            )
+            return response.choices[0].message.content
+
+        return self._call_with_retry(call)
+
+    def prompt_n(self, text: str, n: int = 1, system_prefix: Optional[str] = None) -> list:
+        """Draw n samples in a single API call sharing one prefill."""
+        def call():
+            response = self.client.chat.completions.create(
+                **self._completion_params(text, system_prefix=system_prefix, n=n)
+            )
+            return [choice.message.content for choice in response.choices]
+
+        return self._call_with_retry(call, label="batched")
+
+    @property
+    def aclient(self) -> AsyncAzureOpenAI:
+        """Async twin of the client, resolved per running event loop.
+
+        Looked up lazily so each asyncio.run() gets a client whose
+        connection pool belongs to that loop; see _get_async_client.
+        """
+        return _get_async_client(self.api_key)
+
+    async def _aprompt(self, text: str, system_prefix: Optional[str] = None) -> str:
+        """Async counterpart to prompt() with the same retry/backoff."""
+        async def call():
+            response = await self.aclient.chat.completions.create(
+                **self._completion_params(text, system_prefix=system_prefix)
+            )
+            return response.choices[0].message.content
+
+        return await self._acall_with_retry(call)
+
+    def prompt_many(self, texts: List[str], max_concurrency: int = 16) -> List[str]:
+        """Dispatch distinct prompts concurrently, preserving input order.
+
+        The workload is pure network wait, so a semaphore-bounded gather
+        makes wall time ~max(latency) instead of sum(latency).
+        """
+        async def run():
+            semaphore = asyncio.Semaphore(max_concurrency)
+
+            async def bound(text):
+                async with semaphore:
+                    return await self._aprompt(text)
+
+            return await asyncio.gather(*[bound(text) for text in texts])
+
+        return asyncio.run(run())
 
 
 class O3MiniModel(BaseLLM):
@@ -145,44 +357,41 @@ class O3MiniModel(BaseLLM):
         if not self.api_key:
             raise ValueError("AI_SANDBOX_KEY must be provided or set as environment variable")
         
-        self.client = AzureOpenAI(
-            api_key=self.api_key,
-            azure_endpoint=SANDBOX_ENDPOINT,
-            api_version=SANDBOX_API_VERSION
-        )
-        
+        self.client = _get_client(self.api_key)
+
         self.system_prompt = system_prompt
         self.max_retries = 5
     
-    def prompt(self, text: str) -> str:
-        """Send prompt to O3-Mini with specialized retry logic."""
-        base_delay = 1
-        
-        for attempt in range(self.max_retries):
-            try:
-                response = self.client.chat.completions.create(
-                    model=self.name,
-                    messages=[
-                        {"role": "system", "content": self.system_prompt},
-                        {"role": "user", "content": text},
-                    ]
-                )
-                return response.choices[0].message.content
-                
-            except Exception as e:
-                delay = base_delay * (2 ** attempt) + random.uniform(0, 1)
-                
-                if attempt < self.max_retries - 1:
-                    logger.warning(f"O3-Mini attempt {attempt + 1} failed: {str(e)}. Retrying in {delay:.2f}s...")
-                    time.sleep(delay)
-                else:
-                    logger.error(f"O3-Mini failed after {self.max_retries} attempts: {str(e)}")
-                    raise RuntimeError(f"O3-Mini failed after {self.max_retries} attempts") from e
+    def prompt(self, text: str, system_prefix: Optional[str] = None) -> str:
+        """Send prompt to O3-Mini with the shared retry logic."""
+        messages = [{"role": "system", "content": self.system_prompt}]
+        if system_prefix:
+            messages.append({"role": "system", "content": system_prefix})
+        messages.append({"role": "user", "content": text})
+
+        def call():
+            response = self.client.chat.completions.create(
+                model=self.name,
+                messages=messages
+            )
+            return response.choices[0].message.content
+
+        return self._call_with_retry(call, label="O3-Mini")
 
 
 class MockLLM(BaseLLM):
     """Mock LLM for testing purposes."""
-    
+
+    # Compiled case-insensitive probes and fixed response tuples: the
+    # old text.lower() copied the whole prompt per call just to run two
+    # substring scans. Probes are checked in priority order so 'judge'
+    # still wins when both keywords appear.
+    _JUDGE_RE = re.compile(r'judge', re.IGNORECASE)
+    _APPELLANT_RE = re.compile(r'appellant', re.IGNORECASE)
+    _JUDGE_RESPONSES = ("0.7", "0.8", "0.6", "0.9", "0.5")
+    _APPELLANT_RESPONSES = ("0.3", "0.4", "0.2", "0.5", "0.1")
+    _DEFAULT_RESPONSES = ("0.5", "0.6", "0.4", "0.7", "0.3")
+
     def __init__(
         self,
         name: str = "mock-llm",
@@ -192,19 +401,19 @@ class MockLLM(BaseLLM):
         super().__init__(name, **kwargs)
         self.response_pattern = response_pattern
         self.call_count = 0
-    
+
     def prompt(self, text: str) -> str:
         """Return mock response."""
         self.call_count += 1
-        
+
         # Can provide different responses based on call count or input
-        if "judge" in text.lower():
-            responses = ["0.7", "0.8", "0.6", "0.9", "0.5"]
-        elif "appellant" in text.lower():
-            responses = ["0.3", "0.4", "0.2", "0.5", "0.1"]
+        if self._JUDGE_RE.search(text):
+            responses = self._JUDGE_RESPONSES
+        elif self._APPELLANT_RE.search(text):
+            responses = self._APPELLANT_RESPONSES
         else:
-            responses = ["0.5", "0.6", "0.4", "0.7", "0.3"]
-        
+            responses = self._DEFAULT_RESPONSES
+
         return responses[self.call_count % len(responses)]
 
 
@@ -249,33 +458,62 @@ def create_mock_model(
 def create_model_from_config(config: Dict[str, Any]) -> BaseLLM:
     """
     Create a model instance from configuration dictionary.
-    
+
+    Memoized on the configuration values: pipelines call this in loops
+    with the same config, and every call rebuilt a model for nothing.
+    The returned instance is shared, so callers must not mutate its
+    attributes after creation.
+
     Args:
         config: Configuration dict with 'provider' and model parameters
-        
+
     Returns:
-        Configured model instance
+        Configured model instance (shared across identical configs)
     """
-    provider = config.get("provider", "ai_sandbox").lower()
-    
+    return _build_model(
+        provider=config.get("provider", "ai_sandbox").lower(),
+        model_name=config.get("model_name", "gpt-4o-mini"),
+        api_key=config.get("api_key"),
+        system_prompt=config.get("system_prompt", ""),
+        temperature=config.get("temperature", 0.7),
+        top_p=config.get("top_p", 0.5),
+        max_tokens=config.get("max_tokens", 1024),
+        name=config.get("name", "mock-llm"),
+        response_pattern=config.get("response_pattern", "0.5")
+    )
+
+
+@functools.lru_cache(maxsize=16)
+def _build_model(
+    provider: str,
+    model_name: str,
+    api_key: Optional[str],
+    system_prompt: str,
+    temperature: float,
+    top_p: float,
+    max_tokens: int,
+    name: str,
+    response_pattern: str
+) -> BaseLLM:
+    """Construct a model for a normalized, hashable configuration."""
     if provider == "ai_sandbox":
         return create_ai_sandbox_model(
-            model_name=config.get("model_name", "gpt-4o-mini"),
-            api_key=config.get("api_key"),
-            system_prompt=config.get("system_prompt", ""),
-            temperature=config.get("temperature", 0.7),
-            top_p=config.get("top_p", 0.5),
-            max_tokens=config.get("max_tokens", 1024)
+            model_name=model_name,
+            api_key=api_key,
+            system_prompt=system_prompt,
+            temperature=temperature,
+            top_p=top_p,
+            max_tokens=max_tokens
         )
     elif provider == "o3_mini":
         return create_o3_mini_model(
-            api_key=config.get("api_key"),
-            system_prompt=config.get("system_prompt", "")
+            api_key=api_key,
+            system_prompt=system_prompt
         )
     elif provider == "mock":
         return create_mock_model(
-            name=config.get("name", "mock-llm"),
-            response_pattern=config.get("response_pattern", "0.5")
+            name=name,
+            response_pattern=response_pattern
         )
     else:
         raise ValueError(f"Unsupported model provider: {provider}")
@@ -305,15 +543,35 @@ def sandbox_llm(
     
     This maintains backward compatibility while using the new model structure.
     """
-    model = create_ai_sandbox_model(
-        model_name=model_to_be_used,
+    model = _legacy_sandbox_model(
+        model_to_be_used, system_prompt, temperature, top_p, max_tokens
+    )
+    return model.prompt(prompt)
+
+
+# Memoized instances behind the legacy wrappers: callers loop over these
+# functions, and rebuilding a model (and formerly a client) per call was
+# pure overhead for identical settings
+@functools.lru_cache(maxsize=32)
+def _legacy_sandbox_model(
+    model_name: str,
+    system_prompt: str,
+    temperature: float,
+    top_p: float,
+    max_tokens: int
+) -> "AISandboxModel":
+    return create_ai_sandbox_model(
+        model_name=model_name,
         system_prompt=system_prompt,
         temperature=temperature,
         top_p=top_p,
         max_tokens=max_tokens
     )
-    
-    return model.prompt(prompt)
+
+
+@functools.lru_cache(maxsize=32)
+def _legacy_o3_mini_model(system_prompt: str) -> "O3MiniModel":
+    return create_o3_mini_model(system_prompt=system_prompt)
 
 
 def prompt_o3_mini(
@@ -324,19 +582,20 @@ def prompt_o3_mini(
     """
     Legacy function for O3-Mini compatible with original ai_sandbox.py interface.
     """
-    model = create_o3_mini_model(system_prompt=system_prompt)
-    return model.prompt(prompt)
+    return _legacy_o3_mini_model(system_prompt).prompt(prompt)
 
 
-# Export commonly used models
-DEFAULT_LLM = None  # Will be set by application configuration
+# Lazily constructed default model (see __getattr__ below). Building it
+# at import time forced client construction on every `import pedadog`,
+# even for code paths that never prompt a model.
+_default_llm: Optional[BaseLLM] = None
 
 
 def set_default_llm(model: BaseLLM) -> None:
     """Set the global default LLM."""
-    global DEFAULT_LLM
-    DEFAULT_LLM = model
-    
+    global _default_llm
+    _default_llm = model
+
     # Also set it in generate_belief_vector module
     try:
         from . import generate_belief_vector
@@ -346,13 +605,15 @@ def set_default_llm(model: BaseLLM) -> None:
         pass
 
 
-# Initialize default model if API key is available
-if SANDBOX_API_KEY:
-    try:
-        DEFAULT_LLM = get_default_model()
-    except Exception as e:
-        logger.warning(f"Could not initialize default model: {e}")
-        DEFAULT_LLM = create_mock_model()
-else:
-    logger.info("AI_SANDBOX_KEY not found, DEFAULT_LLM will use mock model")
-    DEFAULT_LLM = create_mock_model()
\ No newline at end of file
+def __getattr__(name: str) -> Any:
+    """Module-level lazy attribute hook (PEP 562) for DEFAULT_LLM."""
+    if name == "DEFAULT_LLM":
+        global _default_llm
+        if _default_llm is None:
+            try:
+                _default_llm = get_default_model()
+            except Exception as e:
+                logger.warning(f"Could not initialize default model: {e}")
+                _default_llm = create_mock_model()
+        return _default_llm
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
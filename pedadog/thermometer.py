@@ -6,62 +6,172 @@ to generate belief distributions about questions in a given context.
 """
 
 import asyncio
+import contextlib
+import inspect
+import json
 import re
 import time
-from typing import List, Dict, Any, Union, Optional
+from itertools import islice
+from typing import List, Dict, Any, Tuple, Union, Optional
 from dataclasses import dataclass
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import numpy as np
-from rich.progress import Progress, TaskID
+from rich.progress import (
+    BarColumn,
+    MofNCompleteColumn,
+    Progress,
+    TaskID,
+    TextColumn,
+    TimeElapsedColumn,
+    TimeRemainingColumn,
+)
 from rich.console import Console
 
+# Default chunk size for models exposing batch_prompt: large enough to
+# keep a continuous-batching backend saturated, small enough to stay
+# inside the server's latency-throughput knee and bound the memory
+# (KV cache) held by any single request batch; override per call via
+# thermo(batch_size=...)
+_BATCH_CHUNK = 32
 
-@dataclass
+# One shared error console on stderr: constructing a Console probes the
+# terminal (isatty and friends) every time, which adds up during error
+# storms, and stderr keeps error lines from interleaving with the
+# Progress bar on stdout
+_CONSOLE = Console(stderr=True)
+
+# Compiled once: extract_numeric_value runs for every sample of every
+# question of every model, and the re module's internal pattern cache
+# still charges a lookup (and can evict) per call
+_NUMERIC_RE = re.compile(r'-?(?:0(?:\.\d+)?|1(?:\.0+)?|\d*\.\d+)')
+
+
+def _supports_system_prefix(model) -> bool:
+    """Whether model.prompt accepts the system_prefix keyword.
+
+    Models that do can receive the shared context as a separate system
+    message, letting the provider serve the context prefill from its
+    prompt cache instead of re-processing it for every sample.
+    """
+    try:
+        return "system_prefix" in inspect.signature(model.prompt).parameters
+    except (TypeError, ValueError):
+        return False
+
+
+@dataclass(slots=True)
 class BeliefResponse:
-    """Container for a single belief measurement response."""
+    """Container for a single belief measurement response.
+
+    Slotted: thermo allocates one of these per sample per (model,
+    question) pair, so dropping the per-instance ``__dict__`` cuts the
+    container memory for large runs by roughly 2-3x.
+    """
     raw_response: str
     numeric_value: Optional[float]
     timestamp: float
     runtime_s: float
 
 
+@dataclass(slots=True)
+class BeliefColumns:
+    """Column-wise (structure-of-arrays) view of sampled responses.
+
+    Numeric values and runtimes live in contiguous NumPy arrays so the
+    stats properties operate on sequential memory instead of chasing one
+    BeliefResponse object per sample; missing numeric values are NaN.
+    """
+    numeric_values: np.ndarray  # float64, NaN where no value was parsed
+    runtimes: np.ndarray        # float32, seconds per sample
+    raw_responses: List[str]
+
+    @classmethod
+    def from_responses(cls, responses: List[BeliefResponse]) -> "BeliefColumns":
+        n = len(responses)
+        numeric_values = np.full(n, np.nan, dtype=np.float64)
+        runtimes = np.empty(n, dtype=np.float32)
+        raw_responses = []
+        for i, r in enumerate(responses):
+            if r.numeric_value is not None:
+                numeric_values[i] = r.numeric_value
+            runtimes[i] = r.runtime_s
+            raw_responses.append(r.raw_response)
+        return cls(numeric_values, runtimes, raw_responses)
+
+
 class BeliefDistribution:
     """Container for belief distribution data with convenience methods."""
-    
+
+    __slots__ = (
+        "model_name", "question", "responses", "cols",
+        "_valid_count", "_mean", "_variance", "_values_arr"
+    )
+
     def __init__(self, model_name: str, question: str, responses: List[BeliefResponse]):
         self.model_name = model_name
         self.question = question
         self.responses = responses
-        self._valid_responses = [r for r in responses if r.numeric_value is not None]
-    
+        # Columnar copy of the samples: the stats properties read these
+        # contiguous arrays instead of rebuilding a Python list and
+        # converting it per access. NaN marks unparsed samples, so the
+        # nan-aware reductions below skip them without a compacted copy.
+        self.cols = BeliefColumns.from_responses(responses)
+        self._valid_count = int(np.count_nonzero(~np.isnan(self.cols.numeric_values)))
+        # Lazily memoized reductions (samples are never mutated after
+        # construction, so first-access caching is safe); stored in
+        # slots since cached_property would need a per-instance __dict__
+        self._mean: Optional[float] = None
+        self._variance: Optional[float] = None
+        self._values_arr: Optional[np.ndarray] = None
+
     @property
-    def values(self) -> List[float]:
-        """Get all valid numeric values."""
-        return [r.numeric_value for r in self._valid_responses]
-    
+    def values(self) -> np.ndarray:
+        """Valid numeric values as a float64 array.
+
+        Returned as an ndarray (compacted once, then reused) so
+        downstream aggregation and plotting stay vectorized instead of
+        re-wrapping a Python list per access; use values_list for a
+        plain list of floats.
+        """
+        if self._values_arr is None:
+            vals = self.cols.numeric_values
+            self._values_arr = vals[~np.isnan(vals)]
+        return self._values_arr
+
+    @property
+    def values_list(self) -> List[float]:
+        """Valid numeric values as a plain Python list."""
+        return self.values.tolist()
+
     @property
     def mean(self) -> float:
         """Calculate mean of valid responses."""
-        if not self._valid_responses:
-            return 0.0
-        return np.mean(self.values)
-    
+        if self._mean is None:
+            if self._valid_count == 0:
+                self._mean = 0.0
+            else:
+                self._mean = float(np.nanmean(self.cols.numeric_values))
+        return self._mean
+
     @property
     def variance(self) -> float:
         """Calculate variance of valid responses."""
-        if len(self._valid_responses) < 2:
-            return 0.0
-        return np.var(self.values)
-    
+        if self._variance is None:
+            if self._valid_count < 2:
+                self._variance = 0.0
+            else:
+                self._variance = float(np.nanvar(self.cols.numeric_values))
+        return self._variance
+
     @property
     def std(self) -> float:
         """Calculate standard deviation of valid responses."""
-        return np.sqrt(self.variance)
-    
+        return float(np.sqrt(self.variance))
+
     @property
     def valid_count(self) -> int:
         """Number of valid numeric responses."""
-        return len(self._valid_responses)
+        return self._valid_count
     
     @property
     def total_count(self) -> int:
@@ -81,12 +191,16 @@ class BeliefResults:
     
     def __init__(self):
         self._results: Dict[str, Dict[str, BeliefDistribution]] = {}
-    
+        # Maintained incrementally so the questions property is O(1)
+        # instead of re-walking every model's results per access
+        self._questions: set = set()
+
     def add_result(self, model_name: str, question: str, distribution: BeliefDistribution):
         """Add a belief distribution result."""
         if model_name not in self._results:
             self._results[model_name] = {}
         self._results[model_name][question] = distribution
+        self._questions.add(question)
     
     def get(self, model_name: str, question: str) -> Optional[BeliefDistribution]:
         """Get a specific belief distribution."""
@@ -110,10 +224,7 @@ class BeliefResults:
     @property
     def questions(self) -> List[str]:
         """Get all unique questions."""
-        questions = set()
-        for model_results in self._results.values():
-            questions.update(model_results.keys())
-        return list(questions)
+        return list(self._questions)
     
     def __getitem__(self, key):
         """Dictionary-like access."""
@@ -136,18 +247,17 @@ def extract_numeric_value(response: str, min_val: float = 0.0, max_val: float =
     Returns:
         Numeric value if found and valid, None otherwise
     """
-    # Look for decimal numbers between min_val and max_val
-    pattern = r'-?(?:0(?:\.\d+)?|1(?:\.0+)?|\d*\.\d+)'
-    matches = re.findall(pattern, response.strip())
-    
-    for match in matches:
+    # Stream the matches and stop at the first in-range hit: model
+    # responses usually lead with the answer, so this avoids scanning
+    # (and materializing) every number in a long response
+    for match in _NUMERIC_RE.finditer(response):
         try:
-            value = float(match)
-            if min_val <= value <= max_val:
-                return value
+            value = float(match.group())
         except ValueError:
             continue
-    
+        if min_val <= value <= max_val:
+            return value
+
     return None
 
 
@@ -157,11 +267,13 @@ def monte_carlo_belief_of(
     n_samples: int = 20,
     min_val: float = 0.0,
     max_val: float = 1.0,
-    max_workers: int = 8
+    max_workers: int = 8,
+    system_prefix: Optional[str] = None,
+    keep_raw: bool = True
 ) -> List[BeliefResponse]:
     """
     Perform Monte Carlo sampling of belief for a single question.
-    
+
     Args:
         question: The question to ask the model
         model: Model object with .prompt(str) method and .name attribute
@@ -169,59 +281,279 @@ def monte_carlo_belief_of(
         min_val: Minimum valid numeric response
         max_val: Maximum valid numeric response
         max_workers: Maximum number of parallel workers
-        
+        system_prefix: Shared context forwarded to models that accept it,
+            so the provider can prefix-cache the context prefill
+        keep_raw: Keep the raw response text on each sample. Set False to
+            drop it right after numeric extraction, so long model outputs
+            are not held for the whole run; error strings are kept either
+            way
+
     Returns:
         List of BeliefResponse objects
     """
+    # Models with native batched sampling (prompt_n issuing one API call
+    # with n=) share a single prefill across all samples, so prefer that
+    # over n_samples independent round-trips
+    prompt_n = getattr(model, "prompt_n", None)
+    if prompt_n is not None and system_prefix is not None:
+        # prompt() accepting system_prefix does not imply prompt_n does
+        # (BaseLLM's generic prompt_n takes no such keyword), so gate the
+        # fast path on prompt_n's own signature; otherwise fall through
+        # to the per-sample path, which forwards the prefix via prompt()
+        try:
+            if "system_prefix" not in inspect.signature(prompt_n).parameters:
+                prompt_n = None
+        except (TypeError, ValueError):
+            prompt_n = None
+    if prompt_n is not None:
+        t0 = time.perf_counter_ns()
+        try:
+            if system_prefix is not None:
+                raw_responses = prompt_n(question, n=n_samples, system_prefix=system_prefix)
+            else:
+                raw_responses = prompt_n(question, n=n_samples)
+        except Exception as e:
+            _CONSOLE.print(f"[red]Error in batched sample query: {e}[/red]")
+            raw_responses = [f"ERROR: {str(e)}"] * n_samples
+        runtime_s = (time.perf_counter_ns() - t0) * 1e-9
+        timestamp = time.time()
+        # runtime_s records the shared batch call; samples are not timed
+        # individually since they arrive in one response
+        return [
+            BeliefResponse(
+                raw_response=raw if keep_raw else "",
+                numeric_value=extract_numeric_value(raw, min_val, max_val),
+                timestamp=timestamp,
+                runtime_s=runtime_s,
+            )
+            for raw in raw_responses
+        ]
+
+    # Per-sample fallback: fan the samples out on the event loop under a
+    # bounded semaphore. The workload is pure network wait, so asyncio
+    # scales past the old 8-thread pool without per-thread stacks or
+    # GIL handoffs; sync-only models still run via worker threads inside
+    # _asingle_belief_query.
+    async def run():
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def bound():
+            async with semaphore:
+                return await _asingle_belief_query(
+                    question, model, min_val, max_val, system_prefix, keep_raw
+                )
+
+        return await asyncio.gather(
+            *[bound() for _ in range(n_samples)], return_exceptions=True
+        )
+
     responses = []
-    
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        # Submit all tasks
-        future_to_sample = {
-            executor.submit(_single_belief_query, question, model, min_val, max_val): i 
-            for i in range(n_samples)
-        }
-        
-        # Collect results as they complete
-        for future in as_completed(future_to_sample):
-            try:
-                response = future.result()
-                responses.append(response)
-            except Exception as e:
-                # Log error but continue with other samples
-                console = Console()
-                console.print(f"[red]Error in sample query: {e}[/red]")
-    
+    for response in asyncio.run(run()):
+        if isinstance(response, BaseException):
+            # Log error but continue with other samples
+            _CONSOLE.print(f"[red]Error in sample query: {response}[/red]")
+        else:
+            responses.append(response)
+
     return responses
 
 
 def _single_belief_query(
     question: str, 
     model, 
-    min_val: float, 
-    max_val: float
+    min_val: float,
+    max_val: float,
+    system_prefix: Optional[str] = None,
+    keep_raw: bool = True
 ) -> BeliefResponse:
     """Execute a single belief query to the model."""
-    start_time = time.time()
-    
+    # Monotonic clock for the duration (one vDSO read, immune to clock
+    # steps); wall-clock time.time() only for the recorded timestamp
+    t0 = time.perf_counter_ns()
+
     try:
-        raw_response = model.prompt(question)
+        if system_prefix is not None:
+            raw_response = model.prompt(question, system_prefix=system_prefix)
+        else:
+            raw_response = model.prompt(question)
         numeric_value = extract_numeric_value(raw_response, min_val, max_val)
+        if not keep_raw:
+            # Free the (possibly long) model output once the number is
+            # extracted; error strings below are always preserved
+            raw_response = ""
     except Exception as e:
         raw_response = f"ERROR: {str(e)}"
         numeric_value = None
-    
-    end_time = time.time()
-    
+
+    runtime_s = (time.perf_counter_ns() - t0) * 1e-9
+
     return BeliefResponse(
         raw_response=raw_response,
         numeric_value=numeric_value,
-        timestamp=end_time,
-        runtime_s=end_time - start_time
+        timestamp=time.time(),
+        runtime_s=runtime_s
     )
 
 
-def thermo(
+async def _asingle_belief_query(
+    question: str,
+    model,
+    min_val: float,
+    max_val: float,
+    system_prefix: Optional[str] = None,
+    keep_raw: bool = True
+) -> BeliefResponse:
+    """Async single belief query; sync-only models run in a worker thread."""
+    aprompt = getattr(model, "aprompt", None) or getattr(model, "_aprompt", None)
+    if aprompt is None:
+        return await asyncio.to_thread(
+            _single_belief_query, question, model, min_val, max_val,
+            system_prefix, keep_raw
+        )
+    t0 = time.perf_counter_ns()
+    try:
+        if system_prefix is not None:
+            raw_response = await aprompt(question, system_prefix=system_prefix)
+        else:
+            raw_response = await aprompt(question)
+        numeric_value = extract_numeric_value(raw_response, min_val, max_val)
+        if not keep_raw:
+            raw_response = ""
+    except Exception as e:
+        raw_response = f"ERROR: {str(e)}"
+        numeric_value = None
+    runtime_s = (time.perf_counter_ns() - t0) * 1e-9
+    return BeliefResponse(
+        raw_response=raw_response,
+        numeric_value=numeric_value,
+        timestamp=time.time(),
+        runtime_s=runtime_s,
+    )
+
+
+async def athermo(
+    questions: List[str],
+    context: str,
+    models: List,
+    n_samples: int = 20,
+    min_val: float = 0.0,
+    max_val: float = 1.0,
+    max_concurrency: int = 8
+) -> BeliefResults:
+    """
+    Async counterpart to thermo().
+
+    Fires every (model, question, sample) query concurrently under a
+    semaphore instead of finishing one question before starting the next,
+    so total wall time approaches one round-trip times the concurrency
+    cap rather than the sum of all calls. Models exposing an async
+    ``aprompt`` are awaited directly; sync models run in worker threads.
+
+    Args:
+        questions: List of questions to ask
+        context: Context string to prepend to questions (can be empty)
+        models: List of model objects with .prompt() method and .name attribute
+        n_samples: Number of Monte Carlo samples per question per model
+        min_val: Minimum valid numeric response
+        max_val: Maximum valid numeric response
+        max_concurrency: Maximum number of in-flight queries
+
+    Returns:
+        BeliefResults object containing all distributions
+    """
+    results = BeliefResults()
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    # Prepare contextualized questions
+    stripped_context = context.strip()
+    contextualized_questions = [
+        f"{stripped_context}\n\n{q}" if stripped_context else q for q in questions
+    ]
+
+    async def single_query(model, contextualized_q: str) -> BeliefResponse:
+        async with semaphore:
+            return await _asingle_belief_query(
+                contextualized_q, model, min_val, max_val
+            )
+
+    # One task per (model, question, sample); gather preserves order
+    keys = []
+    tasks = []
+    for model in models:
+        model_name = getattr(model, 'name', str(model))
+        for question, contextualized_q in zip(questions, contextualized_questions):
+            for _ in range(n_samples):
+                keys.append((model_name, question))
+                tasks.append(single_query(model, contextualized_q))
+
+    responses = await asyncio.gather(*tasks)
+
+    grouped: Dict[tuple, List[BeliefResponse]] = {}
+    for key, response in zip(keys, responses):
+        grouped.setdefault(key, []).append(response)
+
+    for (model_name, question), question_responses in grouped.items():
+        distribution = BeliefDistribution(model_name, question, question_responses)
+        results.add_result(model_name, question, distribution)
+
+    return results
+
+
+def _parse_json_scores(response: str) -> Dict[str, Any]:
+    """Pull the first JSON object out of a model response."""
+    start = response.find('{')
+    end = response.rfind('}')
+    if start == -1 or end <= start:
+        return {}
+    try:
+        parsed = json.loads(response[start:end + 1])
+    except (json.JSONDecodeError, ValueError):
+        return {}
+    return parsed if isinstance(parsed, dict) else {}
+
+
+def _batched_belief_query(
+    prompt_text: str,
+    model,
+    questions: List[str],
+    min_val: float,
+    max_val: float
+) -> Dict[str, BeliefResponse]:
+    """Execute one multi-question query and split it per question."""
+    t0 = time.perf_counter_ns()
+    parsed: Dict[str, Any] = {}
+    raw_response = ""
+
+    # One retry on parse failure: malformed JSON is the common error mode
+    for _ in range(2):
+        try:
+            raw_response = model.prompt(prompt_text)
+        except Exception as e:
+            raw_response = f"ERROR: {str(e)}"
+            break
+        parsed = _parse_json_scores(raw_response)
+        if parsed:
+            break
+
+    runtime_s = (time.perf_counter_ns() - t0) * 1e-9
+    end_time = time.time()
+    responses = {}
+    for question in questions:
+        value = parsed.get(question)
+        if isinstance(value, (int, float)) and min_val <= value <= max_val:
+            numeric_value = float(value)
+        else:
+            numeric_value = None
+        responses[question] = BeliefResponse(
+            raw_response=raw_response,
+            numeric_value=numeric_value,
+            timestamp=end_time,
+            runtime_s=runtime_s,
+        )
+    return responses
+
+
+def thermo_batched(
     questions: List[str],
     context: str,
     models: List,
@@ -229,19 +561,173 @@ def thermo(
     min_val: float = 0.0,
     max_val: float = 1.0,
     max_workers: int = 8
+) -> BeliefResults:
+    """
+    Measure beliefs for all questions with one prompt per sample.
+
+    Questions sharing a context (e.g. every character attribute rated
+    against the same interaction) don't need a prefill each: a single
+    prompt asks the model to score them all and return JSON, cutting
+    backend calls from len(questions) * n_samples to n_samples. Responses
+    that fail to parse (after one retry) yield numeric_value=None for the
+    affected questions, matching the rejection semantics of thermo().
+
+    Args:
+        questions: List of questions to ask (each scored in every sample)
+        context: Context string to prepend (can be empty)
+        models: List of model objects with .prompt() method and .name attribute
+        n_samples: Number of Monte Carlo samples (one API call each)
+        min_val: Minimum valid numeric response
+        max_val: Maximum valid numeric response
+        max_workers: Maximum number of parallel workers
+
+    Returns:
+        BeliefResults object containing all distributions
+    """
+    results = BeliefResults()
+
+    # One shared prompt scoring every question, answered as JSON. Keys
+    # are JSON-encoded so questions containing quotes or newlines still
+    # yield a valid skeleton; json.loads on the model's reply decodes
+    # them back to the original question strings for lookup
+    skeleton = ",\n".join(f'  {json.dumps(q)}: <float>' for q in questions)
+    instructions = (
+        f"Rate each of the following on a scale from {min_val} to {max_val}. "
+        "Respond with only a JSON object of this exact shape:\n"
+        "{\n" + skeleton + "\n}"
+    )
+    stripped_context = context.strip()
+    prompt_text = f"{stripped_context}\n\n{instructions}" if stripped_context else instructions
+
+    for model in models:
+        model_name = getattr(model, 'name', str(model))
+        per_question: Dict[str, List[BeliefResponse]] = {q: [] for q in questions}
+
+        # executor.map streams results off one iterator in submission
+        # order; for a fixed-size batch where arrival order is irrelevant
+        # that skips as_completed's per-future set and condition-variable
+        # bookkeeping. Errors are swallowed per sample via the wrapper,
+        # matching the old per-future try/except.
+        def safe_sample(_) -> Optional[Dict[str, BeliefResponse]]:
+            try:
+                return _batched_belief_query(prompt_text, model,
+                                             questions, min_val, max_val)
+            except Exception as e:
+                _CONSOLE.print(f"[red]Error in batched sample query: {e}[/red]")
+                return None
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for sample in executor.map(safe_sample, range(n_samples)):
+                if sample is None:
+                    continue
+                for question, response in sample.items():
+                    per_question[question].append(response)
+
+        for question, question_responses in per_question.items():
+            distribution = BeliefDistribution(model_name, question, question_responses)
+            results.add_result(model_name, question, distribution)
+
+    return results
+
+
+def thermo_multi_stage(
+    stages: List[tuple],
+    models: List,
+    n_samples: int = 20,
+    min_val: float = 0.0,
+    max_val: float = 1.0,
+    max_concurrency: int = 8
+) -> List[BeliefResults]:
+    """
+    Measure several belief stages whose contexts grow by suffix.
+
+    stages is a list of (questions, added_context) or
+    (questions, added_context, batched) tuples. The context for stage i is
+    the concatenation of every added_context up to and including i, so
+    each stage's prompt prefix is byte-identical to the previous stage's
+    full context. All stages run in one event loop: the provider sees the
+    shared K-token prefix repeatedly within a single burst and serves the
+    later stages from its prompt/KV cache, paying incremental prefill only
+    for each stage's suffix (K + sum(S_i) instead of a full K per stage).
+    The chat completions API is stateless, so the fusion is realized via
+    prefix caching rather than a session handle.
+
+    Stages with batched=True are scored through thermo_batched (one JSON
+    prompt per sample); others sample per question via athermo.
+
+    Args:
+        stages: List of (questions, added_context[, batched]) tuples
+        models: List of model objects with .prompt() method and .name attribute
+        n_samples: Number of Monte Carlo samples per question per model
+        min_val: Minimum valid numeric response
+        max_val: Maximum valid numeric response
+        max_concurrency: Maximum number of in-flight queries per stage
+
+    Returns:
+        List of BeliefResults, one per stage, in input order
+    """
+    specs = []
+    context = ""
+    for stage in stages:
+        questions, added_context = stage[0], stage[1]
+        batched = stage[2] if len(stage) > 2 else False
+        context = f"{context}\n\n{added_context}" if context else added_context
+        specs.append((questions, context, batched))
+
+    async def run_all():
+        coros = []
+        for questions, stage_context, batched in specs:
+            if batched:
+                coros.append(asyncio.to_thread(
+                    thermo_batched, questions, stage_context, models,
+                    n_samples, min_val, max_val, max_concurrency
+                ))
+            else:
+                coros.append(athermo(
+                    questions, stage_context, models,
+                    n_samples, min_val, max_val, max_concurrency
+                ))
+        return await asyncio.gather(*coros)
+
+    return list(asyncio.run(run_all()))
+
+
+def thermo(
+    questions: List[str],
+    context: str,
+    models: List,
+    n_samples: int = 20,
+    min_val: float = 0.0,
+    max_val: float = 1.0,
+    max_workers: int = 8,
+    batch_size: int = _BATCH_CHUNK,
+    cache: Optional[Dict[Tuple[str, str, int], List[BeliefResponse]]] = None
 ) -> BeliefResults:
     """
     Main thermometer function for measuring belief distributions.
-    
+
     Args:
         questions: List of questions to ask
         context: Context string to prepend to questions (can be empty)
-        models: List of model objects with .prompt() method and .name attribute
+        models: List of model objects with .prompt() method and .name
+            attribute. prompt() should reuse a keep-alive connection
+            across calls; a model may also expose a session() context
+            manager, which thermo holds open for the whole run so TLS
+            is negotiated once per model rather than per sample
         n_samples: Number of Monte Carlo samples per question per model
         min_val: Minimum valid numeric response
         max_val: Maximum valid numeric response
         max_workers: Maximum number of parallel workers
-        
+        batch_size: Prompts per batch_prompt request, for models with a
+            bulk endpoint; tune to the backend's preferred batch size
+        cache: Optional memo dict keyed by (model name, contextualized
+            question, n_samples). Pairs already present are served from
+            it without any model calls and fresh results are stored
+            back, so re-running the same sweep in a session is free.
+            Only sensible for deterministic (temperature-0) models;
+            with sampling temperature it silently freezes the first
+            draw
+
     Returns:
         BeliefResults object containing all distributions
     """
@@ -259,45 +745,139 @@ def thermo(
     
     total_tasks = len(questions) * len(models)
     
-    with Progress(console=console) as progress:
-        task = progress.add_task(
-            f"[cyan]Measuring beliefs...", 
-            total=total_tasks
-        )
-        
-        completed_tasks = 0
-        start_time = time.time()
-        
+    # Rich's stock columns render count/elapsed/ETA in its own refresh
+    # cycle, so the per-task hot path below is a bare advance with no
+    # manual ETA arithmetic or description re-formatting
+    with contextlib.ExitStack() as stack, Progress(
+        TextColumn("[cyan]Measuring beliefs..."),
+        BarColumn(),
+        MofNCompleteColumn(),
+        TimeElapsedColumn(),
+        TimeRemainingColumn(),
+        console=console
+    ) as progress:
+        # Models exposing a session() context manager get one keep-alive
+        # connection held open for the whole run, so TLS is negotiated
+        # once per model instead of once per sample; the stack closes
+        # every session when the run finishes
         for model in models:
+            session = getattr(model, 'session', None)
+            if callable(session):
+                stack.enter_context(session())
+
+        task = progress.add_task("beliefs", total=total_tasks)
+
+        def advance():
+            progress.update(task, advance=1)
+
+        batch_models = [
+            model for model in models
+            if callable(getattr(model, 'batch_prompt', None))
+        ]
+        pool_models = [
+            model for model in models
+            if not callable(getattr(model, 'batch_prompt', None))
+        ]
+
+        for model in batch_models:
             model_name = getattr(model, 'name', str(model))
-            
-            for i, (question, contextualized_q) in enumerate(zip(questions, contextualized_questions)):
-                # Perform Monte Carlo sampling for this question-model pair
-                responses = monte_carlo_belief_of(
-                    contextualized_q,
-                    model,
-                    n_samples=n_samples,
-                    min_val=min_val,
-                    max_val=max_val,
-                    max_workers=max_workers
-                )
-                
-                # Create distribution object
+
+            # Serve memoized pairs first; only the misses go into the
+            # batch below
+            pending = []
+            for question, cq in zip(questions, contextualized_questions):
+                if cache is not None and (model_name, cq, n_samples) in cache:
+                    responses = cache[(model_name, cq, n_samples)]
+                    results.add_result(
+                        model_name, question,
+                        BeliefDistribution(model_name, question, responses)
+                    )
+                    advance()
+                else:
+                    pending.append((question, cq))
+
+            # Backends with a bulk endpoint (continuous-batching
+            # inference engines) take every (question, sample) prompt
+            # for this model at once, chunked so one request never
+            # holds the whole workload; results are reshaped back
+            # into per-question distributions below
+            flat_prompts = [
+                cq for _, cq in pending for _ in range(n_samples)
+            ]
+            t0 = time.perf_counter_ns()
+            raw_responses: List[str] = []
+            for chunk_start in range(0, len(flat_prompts), batch_size):
+                chunk = flat_prompts[chunk_start:chunk_start + batch_size]
+                try:
+                    raw_responses.extend(model.batch_prompt(chunk))
+                except Exception as e:
+                    raw_responses.extend([f"ERROR: {str(e)}"] * len(chunk))
+            # runtime_s records the shared batch; samples are not
+            # timed individually since they arrive together
+            batch_runtime = (time.perf_counter_ns() - t0) * 1e-9
+            batch_end = time.time()
+
+            raw_iter = iter(raw_responses)
+            for question, cq in pending:
+                responses = [
+                    BeliefResponse(
+                        raw_response=raw,
+                        numeric_value=extract_numeric_value(raw, min_val, max_val),
+                        timestamp=batch_end,
+                        runtime_s=batch_runtime,
+                    )
+                    for raw in islice(raw_iter, n_samples)
+                ]
+                if cache is not None:
+                    cache[(model_name, cq, n_samples)] = responses
                 distribution = BeliefDistribution(model_name, question, responses)
                 results.add_result(model_name, question, distribution)
-                
-                # Update progress
-                completed_tasks += 1
-                elapsed_time = time.time() - start_time
-                avg_time_per_task = elapsed_time / completed_tasks
-                remaining_tasks = total_tasks - completed_tasks
-                eta = avg_time_per_task * remaining_tasks
-                
-                progress.update(
-                    task,
-                    advance=1,
-                    description=f"[cyan]Beliefs: {completed_tasks}/{total_tasks} "
-                                f"(ETA: {eta:.1f}s, {completed_tasks * n_samples} calls made)"
-                )
-    
+                advance()
+
+        if pool_models:
+            # Every remaining (model, question) pair goes into one pool
+            # instead of running strictly in sequence, so pairs overlap
+            # and the backend sees len(models) * len(questions) worth of
+            # outstanding work; each task still gets the prompt_n
+            # single-prefill fast path inside monte_carlo_belief_of
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                future_to_key = {}
+                stripped_context = context.strip()
+                for model in pool_models:
+                    model_name = getattr(model, 'name', str(model))
+                    # Models accepting system_prefix get the bare question
+                    # plus the context as a separate system message, so
+                    # the provider prefix-caches the context once instead
+                    # of re-prefilling it per sample
+                    use_prefix = bool(stripped_context) and _supports_system_prefix(model)
+                    for question, contextualized_q in zip(questions, contextualized_questions):
+                        if cache is not None and (model_name, contextualized_q, n_samples) in cache:
+                            responses = cache[(model_name, contextualized_q, n_samples)]
+                            results.add_result(
+                                model_name, question,
+                                BeliefDistribution(model_name, question, responses)
+                            )
+                            advance()
+                            continue
+                        future = executor.submit(
+                            monte_carlo_belief_of,
+                            question if use_prefix else contextualized_q,
+                            model,
+                            n_samples=n_samples,
+                            min_val=min_val,
+                            max_val=max_val,
+                            max_workers=max_workers,
+                            system_prefix=stripped_context if use_prefix else None
+                        )
+                        future_to_key[future] = (model_name, question, contextualized_q)
+
+                for future in as_completed(future_to_key):
+                    model_name, question, contextualized_q = future_to_key[future]
+                    responses = future.result()
+                    if cache is not None:
+                        cache[(model_name, contextualized_q, n_samples)] = responses
+                    distribution = BeliefDistribution(model_name, question, responses)
+                    results.add_result(model_name, question, distribution)
+                    advance()
+
     return results
\ No newline at end of file